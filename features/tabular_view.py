@@ -1,15 +1,156 @@
 import numpy as np
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QScrollArea, QPushButton, QCheckBox, QComboBox, QHBoxLayout, QGridLayout, QLabel, QSizePolicy, QHeaderView, QDoubleSpinBox
-from PyQt5.QtCore import Qt, QThread, QObject, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableView, QScrollArea, QPushButton, QCheckBox, QComboBox, QHBoxLayout, QGridLayout, QLabel, QSizePolicy, QHeaderView, QDoubleSpinBox
+from PyQt5.QtCore import Qt, QThread, QObject, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QIcon, QFont, QFontMetrics
 import pyqtgraph as pg
 from datetime import datetime
 import scipy.signal as signal
 import logging
 import sip
+import time
+from collections import deque
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy path in analyze_frame is used instead
+    njit = None
+    prange = range
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Index backing the "latest settings for this project" lookup
+SETTINGS_INDEX = [("projectId", 1), ("updated_at", -1)]
+
+# Latest settings document per projectId: {project_id: (monotonic_ts, doc)}, shared by all views
+_SETTINGS_CACHE = {}
+SETTINGS_CACHE_TTL_SEC = 60
+
+# Display decimals per unit for amplitude/metric cells (anything else: 2 decimals)
+_UNIT_FMT = {"mil": "{:.1f}", "mm": "{:.3f}", "um": "{:.0f}", "v": "{:.3f}"}
+
+# Rows exposed to the view per fetchMore call; larger channel lists are paged in as they scroll into view
+FETCH_CHUNK_ROWS = 200
+
+# Number of past frames kept per channel in the rolling metric histories
+HISTORY_LEN = 50
+
+# FIR length from which overlap-add FFT convolution beats lfilter's direct form on 4096-sample rows
+FFT_FILTER_MIN_TAPS = 128
+
+# Evenly spaced segment bounds used when no usable trigger channel is present (read-only, shared)
+DEFAULT_TRIGGERS = np.array([0, 1024, 2048, 3072], dtype=np.int64)
+DEFAULT_TRIGGERS.setflags(write=False)
+
+# Latest per-channel metrics, one record per channel in a single contiguous block
+SUMMARY_DTYPE = np.dtype([
+    ('freq', 'f4'), ('direct', 'f4'), ('bp', 'f4'),
+    ('one_xa', 'f4'), ('one_xp', 'f4'), ('two_xa', 'f4'), ('two_xp', 'f4'),
+    ('nxa', 'f4'), ('nxp', 'f4'),
+])
+
+def _segment_metrics_loops(raw, band, bounds, orders):
+    """Per-channel segment analysis in plain loops (compiled with numba when available).
+
+    For every trigger segment longer than one sample, accumulate raw/band peak-to-peak and
+    the sin/cos projections for each harmonic order; return the per-segment means as
+    (direct, bandpass, amps[K], phases[K]).
+    """
+    K = orders.shape[0]
+    amp_sum = np.zeros(K)
+    phase_sum = np.zeros(K)
+    direct_sum = 0.0
+    band_sum = 0.0
+    count = 0
+    for j in range(bounds.shape[0] - 1):
+        start = bounds[j]
+        end = bounds[j + 1]
+        N = end - start
+        if N <= 1:
+            continue
+        r_min = r_max = raw[start]
+        b_min = b_max = band[start]
+        sine_sums = np.zeros(K)
+        cosine_sums = np.zeros(K)
+        step = 2.0 * np.pi / N
+        for t in range(start, end):
+            x = raw[t]
+            if x < r_min:
+                r_min = x
+            elif x > r_max:
+                r_max = x
+            y = band[t]
+            if y < b_min:
+                b_min = y
+            elif y > b_max:
+                b_max = y
+            base = step * (t - start)
+            for k in range(K):
+                angle = orders[k] * base
+                sine_sums[k] += x * np.sin(angle)
+                cosine_sums[k] += x * np.cos(angle)
+        direct_sum += r_max - r_min
+        band_sum += b_max - b_min
+        for k in range(K):
+            amp_sum[k] += 4.0 * np.sqrt(sine_sums[k] ** 2 + cosine_sums[k] ** 2) / N
+            phase_sum[k] += np.degrees(np.arctan2(cosine_sums[k], sine_sums[k]))
+        count += 1
+    if count == 0:
+        return 0.0, 0.0, amp_sum, phase_sum
+    return direct_sum / count, band_sum / count, amp_sum / count, phase_sum / count
+
+
+@lru_cache(maxsize=32)
+def _harmonic_basis(seg_len, orders):
+    """Stacked [sin; cos] basis of shape (2K, seg_len) for the given order tuple, reused across frames.
+
+    Trigger spacing is nearly constant at steady speed, so the same few segment lengths recur.
+    """
+    angle = np.outer(orders, (2 * np.pi / seg_len) * np.arange(seg_len))
+    basis = np.vstack((np.sin(angle), np.cos(angle)))
+    basis.setflags(write=False)
+    return basis
+
+
+# Native kernel only when numba is installed; interpreted loops would be slower than NumPy
+_segment_metrics = njit(cache=True, fastmath=True, nogil=True)(_segment_metrics_loops) if njit is not None else None
+
+
+def _frame_metrics_loops(raw, band, bounds, orders):
+    """Run the segment kernel for every channel row; channels are independent so they split across cores."""
+    C = raw.shape[0]
+    K = orders.shape[0]
+    direct = np.zeros(C)
+    bandpass = np.zeros(C)
+    amps = np.zeros((C, K))
+    phases = np.zeros((C, K))
+    for ch in prange(C):
+        d, b, a, p = _segment_metrics(raw[ch], band[ch], bounds, orders)
+        direct[ch] = d
+        bandpass[ch] = b
+        amps[ch, :] = a
+        phases[ch, :] = p
+    return direct, bandpass, amps, phases
+
+
+_frame_metrics = njit(cache=True, parallel=True, nogil=True)(_frame_metrics_loops) if njit is not None else None
+
+
+def _minmax_loops(a):
+    """Min and max of a non-empty 1-D array in a single pass."""
+    lo = a[0]
+    hi = a[0]
+    for v in a:
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi
+
+
+# Plot ranges: one scan with numba; NumPy's separate min()/max() reductions otherwise
+_minmax = njit(cache=True, nogil=True)(_minmax_loops) if njit is not None else None
+
 class TabularViewSettings:
     def __init__(self, project_id):
         self.project_id = project_id
@@ -28,10 +169,109 @@ class TabularViewSettings:
         self.nx_phase_visible = True
         self.updated_at = datetime.utcnow()
 
+class TabularModel(QAbstractTableModel):
+    """Table model backed by a (rows, columns) object array of preformatted cell strings.
+
+    All rows are kept in the backing array, but only the first `_loaded` are exposed through
+    rowCount; the view pulls in the rest FETCH_CHUNK_ROWS at a time via canFetchMore/fetchMore.
+    """
+    _ALIGN_CENTER = int(Qt.AlignCenter)  # converted once; data() is hit for every painted cell
+
+    def __init__(self, headers, font, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._font = font
+        self._cells = np.empty((0, len(self._headers)), dtype=object)
+        self._loaded = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def total_rows(self):
+        """All rows in the backing array, including ones the view has not fetched yet."""
+        return self._cells.shape[0]
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < self._cells.shape[0]
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_CHUNK_ROWS, self._cells.shape[0] - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._cells[index.row(), index.column()]
+        if role == Qt.TextAlignmentRole:
+            return self._ALIGN_CENTER
+        if role == Qt.FontRole:
+            return self._font
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def set_headers(self, headers):
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+
+    def reset_cells(self, cells):
+        """Swap in a full (rows, columns) cell array in one model reset."""
+        self.beginResetModel()
+        self._cells = cells
+        self._loaded = min(FETCH_CHUNK_ROWS, cells.shape[0])
+        self.endResetModel()
+
+    def resize_rows(self, rows):
+        if rows != self._cells.shape[0]:
+            self.reset_cells(np.full((rows, len(self._headers)), "", dtype=object))
+
+    def update_rows(self, cells):
+        """Write a (rows, columns) block from row 0 and emit one dataChanged over the changed cells."""
+        rows = min(cells.shape[0], self._cells.shape[0])
+        current = self._cells[:rows]
+        changed = np.argwhere(current != cells[:rows])
+        if changed.size == 0:
+            return
+        current[...] = cells[:rows]
+        # Rows not fetched yet are stored but not signalled; the view reads them when they are inserted
+        changed = changed[changed[:, 0] < self._loaded]
+        if changed.size == 0:
+            return
+        top, left = changed.min(axis=0)
+        bottom, right = changed.max(axis=0)
+        self.dataChanged.emit(self.index(int(top), int(left)), self.index(int(bottom), int(right)), [Qt.DisplayRole])
+
+    def update_row(self, row, texts):
+        """Write one row of strings and emit dataChanged over the changed span only."""
+        current = self._cells[row]
+        changed = [col for col, text in enumerate(texts) if current[col] != text]
+        if not changed:
+            return
+        for col in changed:
+            current[col] = texts[col]
+        if row >= self._loaded:
+            return
+        self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]), [Qt.DisplayRole])
+
 class TabularViewWorker(QObject):
     finished = pyqtSignal()
     error = pyqtSignal(str)
     initialized = pyqtSignal(list, int, str, dict, str)
+    submit = pyqtSignal(object)  # frame job posted from the GUI thread
+    processed = pyqtSignal(object)  # computed arrays + summary, or None on failure
 
     def __init__(self, parent, project_name, model_name, db):
         super().__init__()
@@ -93,6 +333,14 @@ class TabularViewWorker(QObject):
         finally:
             self.finished.emit()
 
+    def process(self, job):
+        """Run per-frame DSP in the worker thread and hand the results back to the GUI."""
+        try:
+            self.processed.emit(self.parent.analyze_frame(job))
+        except Exception as ex:
+            self.error.emit(f"Error processing frame {job.get('frame_index')}: {str(ex)}")
+            self.processed.emit(None)
+
 class TabularViewFeature:
     def __init__(self, parent, db, project_name, channel=None, model_name=None, console=None):
         self.parent = parent
@@ -106,21 +354,35 @@ class TabularViewFeature:
         self.num_channels = 1
         self.channel_names = ["Channel 1"]
         self.channel_properties = {}
+        # Per-row snapshots of channel_properties, rebuilt in initialize_data_arrays
+        self._units = np.array(["mil"])
+        self._unit_labels = ["mil,pp"]
+        self._subunits = ["pp"]
+        self._unit_fmts = [_UNIT_FMT["mil"]]
+        self._ptp_factors = [1.0]
+        # Calibration folded to counts -> units as scale * raw + bias (empty until first snapshot)
+        self._calib_scale = np.zeros(0, dtype=np.float32)
+        self._calib_bias = np.zeros(0, dtype=np.float32)
         self.project_id = None
         self.selected_channel = 0  # Fixed to Channel 1
-        self.raw_data = [np.zeros(4096)]
-        self.low_pass_data = [np.zeros(4096)]
-        self.high_pass_data = [np.zeros(4096)]
-        self.band_pass_data = [np.zeros(4096)]
+        # Signal arrays are contiguous (channels, 4096) float32 blocks
+        self.raw_data = np.zeros((1, 4096), dtype=np.float32)
+        self.low_pass_data = np.zeros((1, 4096), dtype=np.float32)
+        self.high_pass_data = np.zeros((1, 4096), dtype=np.float32)
+        self.band_pass_data = np.zeros((1, 4096), dtype=np.float32)
+        self._data_buf = np.zeros((1, 4096), dtype=np.float32)
+        # Whole-frame peak-to-peak of raw_data per channel, cached when raw_data is filled
+        self.raw_ptp = np.zeros(1, dtype=np.float32)
+        # Two reusable output buffer sets for the DSP worker (see _frame_buffers)
+        self._frame_buf_sets = []
         self.time_points = np.arange(4096) / self.sample_rate
-        self.band_pass_peak_to_peak_history = [[]]
-        self.band_pass_peak_to_peak_times = [[]]
-        self.average_frequency = [0.0]
-        self.band_pass_peak_to_peak = [0.0]
-        self.one_x_amps = [[]]
-        self.one_x_phases = [[]]
-        self.two_x_amps = [[]]
-        self.two_x_phases = [[]]
+        self.band_pass_peak_to_peak_history = [deque(maxlen=HISTORY_LEN)]
+        self.band_pass_peak_to_peak_times = [deque(maxlen=HISTORY_LEN)]
+        self.summary = np.zeros(1, dtype=SUMMARY_DTYPE)
+        self.one_x_amps = [deque(maxlen=HISTORY_LEN)]
+        self.one_x_phases = [deque(maxlen=HISTORY_LEN)]
+        self.two_x_amps = [deque(maxlen=HISTORY_LEN)]
+        self.two_x_phases = [deque(maxlen=HISTORY_LEN)]
         self.start_time = datetime.now()
         # Use keys that match the table header labels for consistency
         self.column_visibility = {
@@ -130,6 +392,10 @@ class TabularViewFeature:
         }
         self.plot_initialized = False
         self.table = None
+        self.model = None
+        # Bold cell font served to the view through the model's FontRole
+        self._bold_font = QFont("Times New Roman", 10)
+        self._bold_font.setBold(True)
         self.plot_widgets = []
         self.plots = []
         self.plots_enabled = False  # Tabular view: disable graph plotting per user request
@@ -140,10 +406,19 @@ class TabularViewFeature:
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_display)
         self.timer.start(1000)
+        # Gap voltages can arrive at 10+ Hz; coalesce their refreshes to at most 4 per second
+        self._gaps_dirty = False
+        self.gap_timer = QTimer()
+        self.gap_timer.timeout.connect(self._refresh_if_gaps_dirty)
+        self.gap_timer.start(250)
         self.table_initialized = False
         self.data_buffer = []  # Buffer for incoming data
+        self._dsp_busy = False  # one frame in flight on the worker; newer frames wait in data_buffer
         self.last_update_time = datetime.now()
         self.update_interval = 0.5  # Update every 0.5 seconds
+        # DateTime text only changes once per second; reuse it for refreshes within that second
+        self._timestamp_key = None
+        self._timestamp_cache = ""
         # Calibration constants to match Time View
         self.scaling_factor = 3.3 / 65535.0
         self.off_set = 32768
@@ -165,6 +440,7 @@ class TabularViewFeature:
         self._low_pass_coeffs = None
         self._high_pass_coeffs = None
         self._band_pass_coeffs = None
+        self._settings_index_ready = False
         self._last_props_refresh = datetime.min
         self._props_refresh_interval_sec = 5  # avoid DB lookups more than every 5s
         self._last_table_resize = datetime.min
@@ -174,6 +450,15 @@ class TabularViewFeature:
         # Table sizing behavior: auto-fit height unless settings panel is open
         self._auto_table_height = True
         self._prev_table_height = None
+        self._row_h = 36  # uniform row height (slightly taller rows for padding)
+        # Column width hints (px) sized for the fixed cell formats; header labels may widen them
+        self._col_widths = {
+            "Channel Name": 160, "Unit": 110, "DateTime": 210, "RPM": 110, "Gap": 110,
+            "Direct": 130, "Bandpass": 130, "1xAmp": 120, "1xPhase": 110, "2xAmp": 120,
+            "2xPhase": 110, "NXAmp": 130, "NXPhase": 130
+        }
+        # Settings panel: instant show/hide by default; set True to slide it in/out
+        self._animate_settings = False
         self.initUI()
         self.initialize_thread()
 
@@ -191,7 +476,7 @@ class TabularViewFeature:
         """Apply current custom NX headers to the table and settings checkboxes UI."""
         try:
             if self.table:
-                self.table.setHorizontalHeaderLabels(self.get_display_headers())
+                self.model.set_headers(self.get_display_headers())
                 # Keep columns stable when headers change
                 try:
                     self._apply_fixed_column_widths()
@@ -224,10 +509,8 @@ class TabularViewFeature:
         """Keep table headers and checkbox labels in sync with live NX dropdown changes."""
         try:
             # Prefer amp combo, else phase combo
-            if hasattr(self, 'nx_input_amp') and self.nx_input_amp:
-                self.nx_selection = float(self.nx_input_amp.currentText())
-            elif hasattr(self, 'nx_input_phase') and self.nx_input_phase:
-                self.nx_selection = float(self.nx_input_phase.currentText())
+            if self._nx_inputs:
+                self.nx_selection = float(self._nx_inputs[0].currentText())
         except Exception:
             pass
         # Update headers and checkbox labels
@@ -310,6 +593,7 @@ class TabularViewFeature:
         self._nx_allowed_values = ["0.25","0.47","0.48","0.5","0.75","1","2","3","4","5","6","7","8","9","10"]
         self.nx_input_amp = None
         self.nx_input_phase = None
+        self._nx_inputs = ()  # existing NX combos, amp first; filled once the rows are built
 
         # Use internal headers for visibility keys; display text for NX columns will be customized
         headers = list(self.internal_headers)
@@ -424,6 +708,7 @@ class TabularViewFeature:
                 opts_layout.addWidget(cb)
         opts_layout.addStretch()
         opts_scroll.setWidget(opts_container)
+        self._nx_inputs = tuple(combo for combo in (self.nx_input_amp, self.nx_input_phase) if combo)
         # Place the options scroll area below NX rows
         opts_row = 1
         settings_layout.addWidget(opts_scroll, opts_row, 0, 1, 3)
@@ -476,19 +761,19 @@ class TabularViewFeature:
         settings_layout.addWidget(QLabel(""), buttons_row, 2)
 
         # Left content: table + plots scroll area
-        self.table = QTableWidget()
-        self.table.setColumnCount(len(self.internal_headers))
-        self.table.setHorizontalHeaderLabels(self.get_display_headers())
+        self.model = TabularModel(self.get_display_headers(), self._bold_font)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         # Table styling and behavior
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(True)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background: #ffffff;
                 alternate-background-color: #f7f9fc; /* light color for alternate rows */
                 gridline-color: #e0e6ef;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px 14px; /* increased padding for breathing room */
             }
             QHeaderView::section {
@@ -523,7 +808,9 @@ class TabularViewFeature:
         # Do not stretch last section; allow horizontal scroll so fixed widths stay intact
         self.table.horizontalHeader().setStretchLastSection(False)
         self.table.verticalHeader().setVisible(False)
-        self.table.verticalHeader().setDefaultSectionSize(36)  # slightly taller rows for padding
+        # Fixed row height: Qt lays out rows without measuring their contents
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(self._row_h)
         # Size policy: expand horizontally, fixed vertically (we control height)
         self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         # Do not add table directly to main layout; add to left container later
@@ -564,6 +851,8 @@ class TabularViewFeature:
         self._settings_anim = QPropertyAnimation(self.settings_panel, b"maximumWidth")
         self._settings_anim.setDuration(200)
         self._settings_anim.setEasingCurve(QEasingCurve.InOutCubic)
+        # Table repaints are suspended while the panel slides; resume once it settles
+        self._settings_anim.finished.connect(self._resume_table_updates)
         layout.addLayout(content_layout)
 
         # Do not initialize plots (disabled for Tabular View)
@@ -575,11 +864,14 @@ class TabularViewFeature:
         self.thread = QThread()
         self.worker.moveToThread(self.thread)
         self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
+        # Keep the thread alive after initialization: it also runs the streaming DSP
+        self.thread.finished.connect(self.worker.deleteLater)
         self.thread.finished.connect(self.thread.deleteLater)
-        self.worker.error.connect(self.log_and_set_status)
+        # Queued so worker-side errors reach the console on the GUI thread
+        self.worker.error.connect(self.log_and_set_status, Qt.QueuedConnection)
         self.worker.initialized.connect(self.complete_initialization)
+        self.worker.submit.connect(self.worker.process, Qt.QueuedConnection)
+        self.worker.processed.connect(self.on_frame_processed, Qt.QueuedConnection)
         self.thread.start()
 
     def complete_initialization(self, channel_names, num_channels, tag_name, channel_properties, project_id):
@@ -589,7 +881,7 @@ class TabularViewFeature:
             self.tag_name = tag_name
             self.channel_properties = channel_properties
             self.project_id = project_id
-            self.table.setRowCount(self.num_channels)
+            self.model.resize_rows(self.num_channels)
             self.initialize_data_arrays()
             self.update_table_defaults()
             self.load_settings_from_database()
@@ -600,7 +892,7 @@ class TabularViewFeature:
             self.log_and_set_status(f"Error completing initialization: {str(ex)}")
             self.channel_names = ["Channel 1"]
             self.num_channels = 1
-            self.table.setRowCount(1)
+            self.model.resize_rows(1)
             self.initialize_data_arrays()
             self.update_table_defaults()
             self.initialize_plots()
@@ -658,22 +950,44 @@ class TabularViewFeature:
         except Exception:
             return "mil,pp"
 
+    def _snapshot_channel_properties(self):
+        """Flatten channel_properties into per-row arrays so hot paths index instead of doing dict lookups."""
+        names = [self.channel_names[ch] if ch < len(self.channel_names) else f"Channel {ch+1}" for ch in range(self.num_channels)]
+        props = [self.channel_properties.get(name, {}) for name in names]
+        self._units = np.array([str(p.get("Unit", "mil") or "mil").lower().strip() for p in props])
+        self._subunits = [str(p.get("Subunit", "pp") or "pp").lower() for p in props]
+        self._unit_labels = [self._format_unit_display(name) for name in names]
+        # Resolved once here so row rendering does no unit/subunit string handling
+        self._unit_fmts = [_UNIT_FMT.get(unit or "mil", "{:.2f}") for unit in self._units]
+        self._ptp_factors = [self._ptp_subunit_factor(sub) for sub in self._subunits]
+        # volts = (raw - off_set) * scaling_factor; calibrated units additionally * corr * gain / sensitivity
+        scale = np.array([
+            self.scaling_factor * (p.get("CorrectionValue", 1.0) * p.get("Gain", 1.0) / (p.get("Sensitivity", 1.0) or 1.0)
+                                   if unit in ("v", "mm", "um", "mil") else 1.0)
+            for p, unit in zip(props, self._units)
+        ], dtype=np.float64)
+        self._calib_scale = scale.astype(np.float32)
+        self._calib_bias = (-self.off_set * scale).astype(np.float32)
+
     def initialize_data_arrays(self):
-        self.raw_data = [np.zeros(4096) for _ in range(self.num_channels)]
-        self.low_pass_data = [np.zeros(4096) for _ in range(self.num_channels)]
-        self.high_pass_data = [np.zeros(4096) for _ in range(self.num_channels)]
-        self.band_pass_data = [np.zeros(4096) for _ in range(self.num_channels)]
-        self.band_pass_peak_to_peak_history = [[] for _ in range(self.num_channels)]
-        self.band_pass_peak_to_peak_times = [[] for _ in range(self.num_channels)]
-        self.average_frequency = [0.0 for _ in range(self.num_channels)]
-        self.band_pass_peak_to_peak = [0.0 for _ in range(self.num_channels)]
-        self.one_x_amps = [[] for _ in range(self.num_channels)]
-        self.one_x_phases = [[] for _ in range(self.num_channels)]
-        self.two_x_amps = [[] for _ in range(self.num_channels)]
-        self.two_x_phases = [[] for _ in range(self.num_channels)]
+        self._snapshot_channel_properties()
+        # Reused per frame for the normalized incoming samples
+        self._data_buf = np.zeros((self.num_channels, 4096), dtype=np.float32)
+        self.raw_data = np.zeros((self.num_channels, 4096), dtype=np.float32)
+        self.low_pass_data = np.zeros((self.num_channels, 4096), dtype=np.float32)
+        self.high_pass_data = np.zeros((self.num_channels, 4096), dtype=np.float32)
+        self.band_pass_data = np.zeros((self.num_channels, 4096), dtype=np.float32)
+        self.raw_ptp = np.zeros(self.num_channels, dtype=np.float32)
+        self.band_pass_peak_to_peak_history = [deque(maxlen=HISTORY_LEN) for _ in range(self.num_channels)]
+        self.band_pass_peak_to_peak_times = [deque(maxlen=HISTORY_LEN) for _ in range(self.num_channels)]
+        self.summary = np.zeros(self.num_channels, dtype=SUMMARY_DTYPE)
+        self.one_x_amps = [deque(maxlen=HISTORY_LEN) for _ in range(self.num_channels)]
+        self.one_x_phases = [deque(maxlen=HISTORY_LEN) for _ in range(self.num_channels)]
+        self.two_x_amps = [deque(maxlen=HISTORY_LEN) for _ in range(self.num_channels)]
+        self.two_x_phases = [deque(maxlen=HISTORY_LEN) for _ in range(self.num_channels)]
         # Single NX arrays
-        self.nx_amps = [[] for _ in range(self.num_channels)]
-        self.nx_phases = [[] for _ in range(self.num_channels)]
+        self.nx_amps = [deque(maxlen=HISTORY_LEN) for _ in range(self.num_channels)]
+        self.nx_phases = [deque(maxlen=HISTORY_LEN) for _ in range(self.num_channels)]
         self.time_points = np.arange(4096) / self.sample_rate
         if self.console:
             self.console.append_to_console(f"Initialized data arrays for {self.num_channels} channels: {self.channel_names}")
@@ -686,29 +1000,15 @@ class TabularViewFeature:
             self.log_and_set_status("Table widget deleted, skipping update_table_defaults")
             return
         headers = list(self.internal_headers)
-        self.table.setRowCount(self.num_channels)
-        for row in range(self.num_channels):
-            channel_name = self.channel_names[row] if row < len(self.channel_names) else f"Channel {row+1}"
-            unit_display = self._format_unit_display(channel_name)
-            logging.debug(f"Setting unit for channel {channel_name}: {unit_display}")
-            default_data = {
-                "Channel Name": channel_name,
-                "Unit": unit_display,
-                "DateTime": datetime.now().strftime("%d-%b-%Y %I:%M:%S %p"),
-                "RPM": "0.00", "Gap": "0.00", "Direct": "0.00", "Bandpass": "0.00",
-                "1xAmp": "0.00", "1xPhase": "0.00", "2xAmp": "0.00", "2xPhase": "0.00",
-                "NXAmp": "0.00", "NXPhase": "0.00"
-            }
-            for col, internal in enumerate(headers):
-                item = QTableWidgetItem(default_data[internal])
-                item.setTextAlignment(Qt.AlignCenter)
-                # Make table values bold
-                bold_font = QFont("Times New Roman", 10)
-                bold_font.setBold(True)
-                item.setFont(bold_font)
-                self.table.setItem(row, col, item)
-        # Ensure rows use the new padding and height
-        self.table.resizeRowsToContents()
+        if len(self._unit_labels) != self.num_channels:
+            self._snapshot_channel_properties()
+        # Build the whole default grid once and push it in a single model reset
+        defaults = np.full((self.num_channels, len(headers)), "0.00", dtype=object)
+        defaults[:, headers.index("Channel Name")] = [self.channel_names[row] if row < len(self.channel_names) else f"Channel {row+1}" for row in range(self.num_channels)]
+        defaults[:, headers.index("Unit")] = self._unit_labels
+        defaults[:, headers.index("DateTime")] = self._timestamp_text(datetime.now())
+        logging.debug(f"Setting units for channels: {self._unit_labels}")
+        self.model.reset_cells(defaults)
         self.adjust_table_height()
         self.update_column_visibility()
         # Initial content-aware sizing
@@ -729,10 +1029,8 @@ class TabularViewFeature:
         if not getattr(self, "_auto_table_height", True):
             return
         header_height = self.table.horizontalHeader().height() if self.table.horizontalHeader() else 0
-        # Sum heights of all rows
-        total_rows_height = 0
-        for r in range(self.table.rowCount()):
-            total_rows_height += self.table.rowHeight(r)
+        # Rows are fixed height, so the total is a single multiply
+        total_rows_height = self.model.total_rows() * self._row_h
         # Add frame width and a small margin
         frame = self.table.frameWidth() * 2
         margin = 6
@@ -742,11 +1040,30 @@ class TabularViewFeature:
             new_height = header_height + 32 + frame + margin
         self.table.setFixedHeight(new_height)
 
+    def _settings_collection(self):
+        """Return the TabularViewSettings collection, ensuring the (projectId, updated_at) index once."""
+        database = self.mongo_client.get_database("changed_db")
+        settings_collection = database.get_collection("TabularViewSettings")
+        if not self._settings_index_ready:
+            try:
+                settings_collection.create_index(SETTINGS_INDEX)
+                self._settings_index_ready = True
+            except Exception as ex:
+                self.log_and_set_status(f"Could not create settings index: {str(ex)}")
+        return settings_collection
+
     def load_settings_from_database(self):
         try:
-            database = self.mongo_client.get_database("changed_db")
-            settings_collection = database.get_collection("TabularViewSettings")
-            setting = settings_collection.find_one({"projectId": self.project_id}, sort=[("updated_at", -1)])
+            cached = _SETTINGS_CACHE.get(self.project_id)
+            if cached and time.monotonic() - cached[0] < SETTINGS_CACHE_TTL_SEC:
+                setting = cached[1]
+            else:
+                settings_collection = self._settings_collection()
+                cursor = settings_collection.find({"projectId": self.project_id}).sort([("updated_at", -1)]).limit(1)
+                if self._settings_index_ready:
+                    cursor = cursor.hint(SETTINGS_INDEX)
+                setting = next(cursor, None)
+                _SETTINGS_CACHE[self.project_id] = (time.monotonic(), setting)
             if setting:
                 # Load NX selection; fallback to legacy nxAmpSelection if provided
                 try:
@@ -775,14 +1092,11 @@ class TabularViewFeature:
                     cb.setChecked(self.column_visibility.get(header, True))
                 # Update inputs if present
                 try:
-                    if hasattr(self, 'nx_input_amp') and self.nx_input_amp:
-                        self.nx_input_amp.blockSignals(True)
-                        self.nx_input_amp.setCurrentText(self._format_nx_value(self.nx_selection))
-                        self.nx_input_amp.blockSignals(False)
-                    if hasattr(self, 'nx_input_phase') and self.nx_input_phase:
-                        self.nx_input_phase.blockSignals(True)
-                        self.nx_input_phase.setCurrentText(self._format_nx_value(self.nx_selection))
-                        self.nx_input_phase.blockSignals(False)
+                    nx_text = self._format_nx_value(self.nx_selection)
+                    for combo in self._nx_inputs:
+                        combo.blockSignals(True)
+                        combo.setCurrentText(nx_text)
+                        combo.blockSignals(False)
                 except Exception:
                     pass
             self.update_column_visibility()
@@ -795,46 +1109,32 @@ class TabularViewFeature:
                 self.column_visibility[header] = cb.isChecked()
             # Read harmonic selections from dropdowns
             try:
-                if hasattr(self, 'nx_input_amp') and self.nx_input_amp:
-                    self.nx_selection = float(self.nx_input_amp.currentText())
-                elif hasattr(self, 'nx_input_phase') and self.nx_input_phase:
-                    self.nx_selection = float(self.nx_input_phase.currentText())
+                if self._nx_inputs:
+                    self.nx_selection = float(self._nx_inputs[0].currentText())
             except Exception:
                 pass
             # Update headers
             self.custom_nx_amp_header = f"NxAmp({self._format_nx_value(self.nx_selection)})"; self.custom_nx_phase_header = f"NxPhase({self._format_nx_value(self.nx_selection)})"
-            settings = TabularViewSettings(self.project_id)
-            settings.channel_name_visible = self.column_visibility["Channel Name"]
-            settings.unit_visible = self.column_visibility["Unit"]
-            settings.datetime_visible = self.column_visibility["DateTime"]
-            settings.rpm_visible = self.column_visibility["RPM"]
-            settings.gap_visible = self.column_visibility["Gap"]
-            settings.direct_visible = self.column_visibility["Direct"]
-            settings.bandpass_visible = self.column_visibility["Bandpass"]
-            # Map UI keys back to DB fields
-            settings.one_xa_visible = self.column_visibility["1xAmp"]
-            settings.one_xp_visible = self.column_visibility["1xPhase"]
-            settings.two_xa_visible = self.column_visibility["2xAmp"]
-            settings.two_xp_visible = self.column_visibility["2xPhase"]
-            # Additional NX visibilities are stored directly in the document
-            database = self.mongo_client.get_database("changed_db")
-            settings_collection = database.get_collection("TabularViewSettings")
-            settings_collection.insert_one({
+            cv = self.column_visibility
+            settings_collection = self._settings_collection()
+            # One settings document per project: overwrite in place rather than appending history
+            doc = {
                 "projectId": self.project_id,
-                "channelNameVisible": settings.channel_name_visible,
-                "unitVisible": settings.unit_visible,
-                "datetimeVisible": settings.datetime_visible,
-                "rpmVisible": settings.rpm_visible,
-                "gapVisible": settings.gap_visible,
-                "directVisible": settings.direct_visible,
-                "bandpassVisible": settings.bandpass_visible,
-                "oneXaVisible": settings.one_xa_visible,
-                "oneXpVisible": settings.one_xp_visible,
-                "twoXaVisible": settings.two_xa_visible,
-                "twoXpVisible": settings.two_xp_visible,
+                # Map UI keys back to DB fields
+                "channelNameVisible": cv["Channel Name"],
+                "unitVisible": cv["Unit"],
+                "datetimeVisible": cv["DateTime"],
+                "rpmVisible": cv["RPM"],
+                "gapVisible": cv["Gap"],
+                "directVisible": cv["Direct"],
+                "bandpassVisible": cv["Bandpass"],
+                "oneXaVisible": cv["1xAmp"],
+                "oneXpVisible": cv["1xPhase"],
+                "twoXaVisible": cv["2xAmp"],
+                "twoXpVisible": cv["2xPhase"],
                 # NX visibility
-                "nxAmpVisible": self.column_visibility.get("NXAmp", True),
-                "nxPhaseVisible": self.column_visibility.get("NXPhase", True),
+                "nxAmpVisible": cv.get("NXAmp", True),
+                "nxPhaseVisible": cv.get("NXPhase", True),
                 # Selection (store single)
                 "nxSelection": float(self.nx_selection),
                 # Legacy compatibility fields
@@ -843,8 +1143,11 @@ class TabularViewFeature:
                 # Custom headers
                 "customNXAmpHeader": self.custom_nx_amp_header,
                 "customNXPhaseHeader": self.custom_nx_phase_header,
-                "updated_at": settings.updated_at
-            })
+                "updated_at": datetime.utcnow()
+            }
+            settings_collection.update_one({"projectId": self.project_id}, {"$set": doc}, upsert=True)
+            # Write-through so the next load in any view skips the round trip
+            _SETTINGS_CACHE[self.project_id] = (time.monotonic(), doc)
             self.update_column_visibility()
             # Apply updated header labels to table and checkbox text
             self.apply_custom_headers()
@@ -857,10 +1160,14 @@ class TabularViewFeature:
         opening = not self.settings_panel.isVisible()
         if opening:
             self.settings_panel.setVisible(True)
-            self._settings_anim.stop()
-            self._settings_anim.setStartValue(self.settings_panel.maximumWidth())
-            self._settings_anim.setEndValue(self._settings_width)
-            self._settings_anim.start()
+            if self._animate_settings:
+                self._settings_anim.stop()
+                self.table.setUpdatesEnabled(False)
+                self._settings_anim.setStartValue(self.settings_panel.maximumWidth())
+                self._settings_anim.setEndValue(self._settings_width)
+                self._settings_anim.start()
+            else:
+                self.settings_panel.setMaximumWidth(self._settings_width)
             self.settings_button.setVisible(False)
             # When settings open: enable table vertical scrolling and set a compact fixed height
             try:
@@ -876,44 +1183,52 @@ class TabularViewFeature:
             self.close_settings()
 
     def close_settings(self):
+        if not self._animate_settings:
+            self._settings_anim.stop()
+            self.settings_panel.setMaximumWidth(0)
+            self._after_settings_closed()
+            return
         # Animate close then hide
         self._settings_anim.stop()
+        self.table.setUpdatesEnabled(False)
         self._settings_anim.setStartValue(self.settings_panel.maximumWidth())
         self._settings_anim.setEndValue(0)
-        def _after():
-            self.settings_panel.setVisible(False)
-            self.settings_button.setVisible(True)
-            # Restore table auto-height and remove internal vertical scrollbar
-            try:
-                self._auto_table_height = True
-                self.table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-                # Restore previous height if remembered; otherwise auto-adjust
-                if self._prev_table_height is not None:
-                    # Temporarily set then auto-adjust to actual content
-                    self.table.setFixedHeight(self._prev_table_height)
-                    self._prev_table_height = None
-                # Apply auto adjust to fit all rows
-                self.adjust_table_height()
-            except Exception:
-                pass
-        self._settings_anim.finished.connect(_after)
+        self._settings_anim.finished.connect(self._after_settings_closed)
         self._settings_anim.start()
         # Disconnect the temporary slot after it's called once to avoid accumulation
         def _cleanup():
             try:
-                self._settings_anim.finished.disconnect(_after)
+                self._settings_anim.finished.disconnect(self._after_settings_closed)
             except Exception:
                 pass
         self._settings_anim.finished.connect(_cleanup)
 
+    def _resume_table_updates(self):
+        if self.table and not sip.isdeleted(self.table):
+            self.table.setUpdatesEnabled(True)
+
+    def _after_settings_closed(self):
+        """Hide the settings panel and hand the table back its auto-fit height."""
+        self.settings_panel.setVisible(False)
+        self.settings_button.setVisible(True)
+        # Restore table auto-height and remove internal vertical scrollbar
+        try:
+            self._auto_table_height = True
+            self.table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+            # Restore previous height if remembered; otherwise auto-adjust
+            if self._prev_table_height is not None:
+                # Temporarily set then auto-adjust to actual content
+                self.table.setFixedHeight(self._prev_table_height)
+                self._prev_table_height = None
+            # Apply auto adjust to fit all rows
+            self.adjust_table_height()
+        except Exception:
+            pass
+
     def on_column_toggle(self, header, checked):
         # header here is the internal key (we key checkbox_dict by internal) so use as-is
         self.column_visibility[header] = checked
         self.update_column_visibility()
-        try:
-            self.table.resizeColumnsToContents()
-        except Exception:
-            pass
 
     def update_column_visibility(self):
         # Use internal header order to control visibility
@@ -927,86 +1242,115 @@ class TabularViewFeature:
             pass
 
     def get_trigger_indices(self, trigger_data):
-        trigger_data = np.array(trigger_data)
+        """Rising-edge sample indices of the trigger channel as an int64 array."""
+        trigger_data = np.asarray(trigger_data, dtype=np.float32)
         threshold = 0.5
         max_attempts = 5
         for attempt in range(max_attempts):
-            indices = []
-            for i in range(1, len(trigger_data)):
-                if trigger_data[i-1] < threshold and trigger_data[i] >= threshold:
-                    indices.append(i)
-            if len(indices) >= 2:
-                return indices
+            # Rising edges: previous sample below threshold, current at/above it
+            indices = np.flatnonzero((trigger_data[:-1] < threshold) & (trigger_data[1:] >= threshold)) + 1
+            if indices.size >= 2:
+                return indices.astype(np.int64, copy=False)
             threshold /= 2
         # Fallback to artificial triggers
-        return [0, 1024, 2048, 3072]
+        return DEFAULT_TRIGGERS
+
+    def _frequency_channel_hz(self, samples):
+        """Mean of the positive, finite samples of the frequency channel in Hz (0.0 if none).
+
+        Zeros/spikes are masked out in the reduction itself instead of copying the valid samples.
+        """
+        freq_vals = np.asarray(samples, dtype=float)
+        mask = np.isfinite(freq_vals) & (freq_vals > 0)
+        count = np.count_nonzero(mask)
+        if count == 0:
+            return 0.0
+        # Frequency arrives scaled x100; convert back to Hz
+        return float(np.sum(freq_vals, where=mask)) / count / 100.0
+
+    def _trigger_frequency_hz(self, triggers, sample_rate):
+        """Rotation frequency from the mean trigger spacing; 0.0 with fewer than two triggers."""
+        if len(triggers) < 2:
+            return 0.0
+        # Mean of consecutive differences telescopes to (last - first) / (count - 1)
+        avg_period = float(triggers[-1] - triggers[0]) / (len(triggers) - 1)
+        return float(sample_rate) / avg_period if avg_period > 0 else 0.0
 
     def compute_harmonics(self, data, start_idx, segment_length, order):
         try:
             if segment_length <= 0 or start_idx >= len(data) or start_idx + segment_length > len(data):
                 return 0.0, 0.0
-            segment = data[start_idx:start_idx + segment_length]
+            segment = np.asarray(data[start_idx:start_idx + segment_length], dtype=float)
             N = len(segment)
             if N < 2:
                 return 0.0, 0.0
-            sine_sum = 0.0
-            cosine_sum = 0.0
-            for t in range(N):
-                angle = 2 * np.pi * order * t / N
-                sine_sum += segment[t] * np.sin(angle)
-                cosine_sum += segment[t] * np.cos(angle)
-            amp = np.sqrt((sine_sum / N)**2 + (cosine_sum / N)**2) * 4
-            phase = np.arctan2(cosine_sum, sine_sum) * 180 / np.pi
-            return amp, phase
+            # Amplitude and phase both come from one projection onto the cached sin/cos pair
+            sine_sum, cosine_sum = _harmonic_basis(N, (float(order),)) @ segment
+            amp = 4 * np.hypot(sine_sum, cosine_sum) / N
+            phase = np.degrees(np.arctan2(cosine_sum, sine_sum))
+            return float(amp), float(phase)
         except Exception as ex:
             self.log_and_set_status(f"Error computing harmonics: {str(ex)}")
             return 0.0, 0.0
 
+    def _segment_harmonic_means(self, block, triggers, orders):
+        """Mean harmonic amplitudes and phases per row of block over trigger segments.
+
+        Each segment is projected onto the cached sin/cos basis for all rows and orders in one
+        matrix product; returns (amps, phases), each shaped (rows, len(orders)).
+        """
+        K = len(orders)
+        key = tuple(float(o) for o in orders)
+        amp_sum = np.zeros((block.shape[0], K))
+        phase_sum = np.zeros((block.shape[0], K))
+        count = 0
+        # Plain ints for slicing and the basis cache key
+        bounds = np.asarray(triggers).tolist()
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if end - start <= 1:
+                continue
+            count += 1
+            N = end - start
+            sums = block[:, start:end] @ _harmonic_basis(N, key).T
+            sine_sums, cosine_sums = sums[:, :K], sums[:, K:]
+            amp_sum += 4 * np.hypot(sine_sums, cosine_sums) / N
+            phase_sum += np.degrees(np.arctan2(cosine_sums, sine_sums))
+        if count == 0:
+            return amp_sum, phase_sum
+        return amp_sum / count, phase_sum / count
+
     def process_calibrated_data(self, values, ch):
-        channel_name = self.channel_names[ch] if ch < len(self.channel_names) else f"Channel {ch+1}"
-        props = self.channel_properties.get(channel_name, {
-            "CorrectionValue": 1.0,
-            "Gain": 1.0,
-            "Sensitivity": 1.0,
-            "Unit": "mil"
-        })
         try:
-            volts = (np.array(values, dtype=float) - self.off_set) * self.scaling_factor
-            unit = (props.get("Unit", "mil") or "mil").lower()
-            if unit == "v":
-                calibrated = (volts * props["CorrectionValue"] * props["Gain"]) / props["Sensitivity"]
-            elif unit == "mm":
-                calibrated = (volts * (props["CorrectionValue"] * props["Gain"])) / props["Sensitivity"]
-            elif unit == "um":
-                calibrated = (volts * (props["CorrectionValue"] * props["Gain"])) / props["Sensitivity"]
-            elif unit == "mil":
-                calibrated = (volts * (props["CorrectionValue"] * props["Gain"])) / props["Sensitivity"]
-            else:
-                calibrated = volts 
-            logging.debug(f"Processed data for {channel_name} with unit {unit}, shape: {calibrated.shape}")
-            return calibrated
+            if ch >= len(self._calib_scale):
+                # Row not in the current snapshot (channel layout changing); plain volts
+                return (np.asarray(values, dtype=np.float32) - self.off_set) * np.float32(self.scaling_factor)
+            return np.asarray(values, dtype=np.float32) * self._calib_scale[ch] + self._calib_bias[ch]
         except Exception as ex:
-            self.log_and_set_status(f"Error processing calibrated data for {channel_name}: {str(ex)}")
+            self.log_and_set_status(f"Error processing calibrated data for channel {ch}: {str(ex)}")
             return np.zeros(4096)
 
+    def _calibrate_rows(self, norm_values, scale, bias, out):
+        """Calibrate rows of norm_values into out; rows beyond the scale/bias snapshot get plain volts.
+
+        Does no logging, so it is safe on the worker thread; errors propagate to the caller.
+        """
+        rows = min(out.shape[0], len(scale))
+        np.multiply(norm_values[:rows], scale[:rows, np.newaxis], out=out[:rows])
+        out[:rows] += bias[:rows, np.newaxis]
+        if rows < out.shape[0]:
+            # Rows not in the snapshot (channel layout changing)
+            out[rows:] = (norm_values[rows:out.shape[0]] - self.off_set) * np.float32(self.scaling_factor)
+
     def format_direct_value(self, values, unit):
         if not values or len(values) == 0:
             return "0.00"
         # Values are already calibrated to the selected unit; only format
-        avg = float(np.mean(values))
-        unit = (unit or "mil").lower()
-        # Unit-based decimals for amplitude/metrics:
-        # mil: 1 decimal, mm: 3 decimals, um: 0 decimals, v: 3 decimals, default: 2
-        if unit == "mil":
-            return f"{avg:.1f}"
-        elif unit == "mm":
-            return f"{avg:.3f}"
-        elif unit == "um":
-            return f"{avg:.0f}"
-        elif unit == "v":
-            return f"{avg:.3f}"
-        else:
-            return f"{avg:.2f}"
+        avg = float(values[0]) if len(values) == 1 else float(np.mean(values))
+        return self.format_direct_scalar(avg, unit)
+
+    def format_direct_scalar(self, value, unit):
+        """Format one already-averaged amplitude; the table hot path uses this instead of a 1-item list."""
+        return _UNIT_FMT.get((unit or "mil").lower(), "{:.2f}").format(value)
 
     def format_direct_bandpass_value(self, value, unit):
         """Format Direct and Bandpass values with unit-specific decimals.
@@ -1016,23 +1360,9 @@ class TabularViewFeature:
         - um: 0 decimals
         - v: 3 decimals
         """
-        try:
-            if value is None:
-                return "0.0"
-            unit = (unit or "mil").lower()
-            val = float(value)
-            if unit == "mil":
-                return f"{val:.1f}"
-            elif unit == "mm":
-                return f"{val:.3f}"
-            elif unit == "um":
-                return f"{val:.0f}"
-            elif unit == "v":
-                return f"{val:.3f}"
-            # default fallback
-            return f"{val:.2f}"
-        except Exception:
+        if value is None:
             return "0.0"
+        return _UNIT_FMT.get((unit or "mil").lower(), "{:.2f}").format(float(value))
 
     def _convert_ptp_by_subunit(self, ptp_value, subunit):
         """Convert a peak-to-peak value into the desired subunit.
@@ -1041,20 +1371,19 @@ class TabularViewFeature:
         try:
             if ptp_value is None:
                 return 0.0
-            sub = (subunit or "pp").lower().strip()
-            if sub in ("pk-pk", "peak to peak", "peak-to-peak", "peak2peak", "p2p", "ppk", "peaktopeak"):
-                sub = "pp"
-            elif sub in ("peak", "pk"):
-                sub = "pk"
-            v = float(ptp_value)
-            if sub == "pk":
-                return v / 2.0
-            if sub == "rms":
-                return v / (2.0 * np.sqrt(2.0))
-            return v
+            return float(ptp_value) * self._ptp_subunit_factor(subunit)
         except Exception:
             return float(ptp_value or 0.0)
 
+    def _ptp_subunit_factor(self, subunit):
+        """Multiplier taking a peak-to-peak value to the given subunit (see _convert_ptp_by_subunit)."""
+        sub = (subunit or "pp").lower().strip()
+        if sub in ("peak", "pk"):
+            return 0.5
+        if sub == "rms":
+            return 1.0 / (2.0 * np.sqrt(2.0))
+        return 1.0
+
     def on_data_received(self, tag_name, model_name, values, sample_rate, frame_index):
         if not values or len(values) < 1:
             self.log_and_set_status(f"Insufficient data received for frame {frame_index}: {len(values)} channels")
@@ -1068,12 +1397,16 @@ class TabularViewFeature:
     def process_buffered_data(self):
         if not self.data_buffer:
             return
+        if self._dsp_busy:
+            # Previous frame still on the worker; keep only the newest pending frame
+            self.data_buffer = self.data_buffer[-1:]
+            return
+        frame_index = None
         try:
             # Avoid DB calls on the UI thread during streaming. Settings/props are
             # already loaded during initialization and via explicit actions.
             # If a props refresh is needed, it should be triggered explicitly
             # from non-streaming UI interactions to prevent stalls.
-            now = datetime.now()
             values, sample_rate, frame_index = self.data_buffer[-1]  # Process the latest data
             self.data_buffer = []  # Clear buffer after processing
 
@@ -1088,174 +1421,269 @@ class TabularViewFeature:
 
             total_channels = len(values)
             expected_main = max(1, len(self.channel_names))  # from model definition
-            # Normalize incoming values to expected_main (pad missing with zeros, truncate extras)
-            norm_values = []
-            for i in range(expected_main):
-                if i < total_channels and isinstance(values[i], (list, np.ndarray)) and len(values[i]) > 0:
-                    norm_values.append(values[i])
-                else:
-                    # pad with zeros to 4096
-                    norm_values.append([0.0] * 4096)
             # Determine inferred tacho count from remaining payload channels
             inferred_tacho = max(0, total_channels - expected_main)
             if inferred_tacho > 2:
                 inferred_tacho = 2
             # Always keep model-defined main channel count visible
-            if self.num_channels != expected_main or self.table.rowCount() != expected_main:
+            if self.num_channels != expected_main or self.model.total_rows() != expected_main:
                 self.num_channels = expected_main
-                self.table.setRowCount(self.num_channels)
+                self.model.resize_rows(self.num_channels)
                 self.initialize_data_arrays()
                 self.update_table_defaults()
                 self.initialize_plots()
 
-            # Normalize each channel length to 4096
-            for i in range(len(norm_values)):
-                if len(norm_values[i]) < 4096:
-                    norm_values[i] = list(np.pad(norm_values[i], (0, 4096 - len(norm_values[i])), 'constant'))[:4096]
-                elif len(norm_values[i]) > 4096:
-                    norm_values[i] = norm_values[i][:4096]
+            # Normalize incoming values into the preallocated (expected_main, 4096) buffer:
+            # missing channels become zeros, short channels are zero-padded, long ones truncated.
+            # Safe to overwrite here: the worker is idle whenever we get this far.
+            norm_values = self._data_buf
+            for i in range(expected_main):
+                v = values[i] if i < total_channels and isinstance(values[i], (list, np.ndarray)) else ()
+                n = min(len(v), 4096)
+                norm_values[i, :n] = v[:n]
+                norm_values[i, n:] = 0.0
 
             self.sample_rate = sample_rate if sample_rate and sample_rate > 0 else self.sample_rate
             self.data = norm_values
-            if self.console and (datetime.now() - self._last_log_time).total_seconds() >= self._log_interval_sec:
+            now = datetime.now()
+            if self.console and (now - self._last_log_time).total_seconds() >= self._log_interval_sec:
                 self.console.append_to_console(f"Processing buffered data for frame {frame_index}, mains={self.num_channels}, tacho={inferred_tacho}")
-                self._last_log_time = datetime.now()
+                self._last_log_time = now
 
-            # Compute triggers from tacho trigger channel (prefer second tacho if present)
-            trigger_index = self.num_channels + 1 if inferred_tacho >= 2 else (self.num_channels if inferred_tacho >= 1 else None)
-            trigger_data = values[trigger_index] if trigger_index is not None and len(values) > trigger_index else []
-            triggers = self.get_trigger_indices(trigger_data) if len(trigger_data) > 0 else [0, 1024, 2048, 3072]
+            # FIR taps are designed here on the GUI thread; the worker only reads the job's copy
+            self._ensure_filters()
+            if self._low_pass_coeffs is None:
+                return
+            # Snapshot everything the DSP needs so the worker never reads mutable UI state
+            job = {
+                "values": values,
+                "norm_values": norm_values,
+                "frame_index": frame_index,
+                "num_channels": self.num_channels,
+                "inferred_tacho": inferred_tacho,
+                "sample_rate": self.sample_rate,
+                "nx_selection": self.nx_selection,
+                "filters": (self._low_pass_coeffs, self._high_pass_coeffs, self._band_pass_coeffs),
+                # Per-channel calibration; _snapshot_channel_properties replaces these arrays, never mutates them
+                "calib_scale": self._calib_scale,
+                "calib_bias": self._calib_bias,
+                # Output arrays picked here, on the GUI thread, from the set it is not showing
+                "buffers": self._frame_buffers(self.num_channels),
+            }
+            worker = getattr(self, 'worker', None)
+            if worker is not None and not sip.isdeleted(worker) and self.thread.isRunning():
+                self._dsp_busy = True
+                worker.submit.emit(job)
+            else:
+                # Worker thread unavailable (e.g. shutting down); process inline
+                self.on_frame_processed(self.analyze_frame(job))
+        except Exception as ex:
+            self._dsp_busy = False
+            self.log_and_set_status(f"Error processing buffered data for frame {frame_index}: {str(ex)}")
 
-            # Compute Tacho frequency (Hz) from trigger indices
-            tacho_freq = 0.0
-            # Prefer direct frequency channel if present (first tacho channel after main channels)
-            try:
-                freq_ch_idx = self.num_channels if inferred_tacho >= 1 else None
-                if freq_ch_idx is not None and len(values) > freq_ch_idx and len(values[freq_ch_idx]) > 0:
-                    # Use mean of positive frequencies to avoid zeros/spikes
-                    freq_vals = np.array(values[freq_ch_idx], dtype=float)
-                    freq_vals = freq_vals[np.isfinite(freq_vals) & (freq_vals > 0)]
-                    if freq_vals.size > 0:
-                        # Frequency arrives scaled x100; convert back to Hz
-                        tacho_freq = float(np.mean(freq_vals)) / 100.0
-            except Exception:
-                # Ignore and fallback to trigger-based estimation
-                pass
-            # Fallback to trigger-based estimation if no valid freq found
-            if tacho_freq <= 0.0 and len(triggers) >= 2:
-                diffs = np.diff(triggers)
-                if len(diffs) > 0:
-                    avg_period = float(np.mean(diffs))
-                    if avg_period > 0:
-                        tacho_freq = float(self.sample_rate) / avg_period
-
-            # Process each main channel
+    def analyze_frame(self, job):
+        """Compute filtered arrays and per-channel summary for one frame (runs on the worker thread).
+
+        Reads only the job and immutable constants, and never logs to the console; failures raise
+        and TabularViewWorker.process reports them through its queued error signal.
+        """
+        values = job["values"]
+        norm_values = job["norm_values"]
+        num_channels = job["num_channels"]
+        inferred_tacho = job["inferred_tacho"]
+        sample_rate = job["sample_rate"]
+
+        # Compute triggers from tacho trigger channel (prefer second tacho if present)
+        trigger_index = num_channels + 1 if inferred_tacho >= 2 else (num_channels if inferred_tacho >= 1 else None)
+        trigger_data = values[trigger_index] if trigger_index is not None and len(values) > trigger_index else []
+        triggers = self.get_trigger_indices(trigger_data) if len(trigger_data) > 0 else DEFAULT_TRIGGERS
+
+        # Compute Tacho frequency (Hz) from trigger indices
+        tacho_freq = 0.0
+        # Prefer direct frequency channel if present (first tacho channel after main channels)
+        try:
+            freq_ch_idx = num_channels if inferred_tacho >= 1 else None
+            if freq_ch_idx is not None and len(values) > freq_ch_idx and len(values[freq_ch_idx]) > 0:
+                tacho_freq = self._frequency_channel_hz(values[freq_ch_idx])
+        except Exception:
+            # Ignore and fallback to trigger-based estimation
+            pass
+        # Fallback to trigger-based estimation if no valid freq found
+        if tacho_freq <= 0.0:
+            tacho_freq = self._trigger_frequency_hz(triggers, sample_rate)
+
+        # NX selection (single)
+        try:
+            n = float(job["nx_selection"])
+        except Exception:
+            n = 3.0
+        # 1X, 2X and the selected NX evaluated together per segment
+        orders = np.array([1.0, 2.0, n])
+
+        raw_data, low_pass_data, high_pass_data, band_pass_data = job["buffers"]
+        summary = np.zeros(num_channels, dtype=SUMMARY_DTYPE)
+        # Calibrate all main channels into the preallocated float32 block from the job's snapshot
+        self._calibrate_rows(norm_values, job["calib_scale"], job["calib_bias"], raw_data)
+        # Filter all channels at once, one call per band, with the taps snapshotted in the job
+        self._filter_block(job["filters"], raw_data, low_pass_data, high_pass_data, band_pass_data)
+        self._fill_segment_summary(summary, tacho_freq, raw_data, band_pass_data, triggers, orders)
+        return self._frame_result(job, summary, raw_data, low_pass_data, high_pass_data, band_pass_data)
+
+    def _frame_result(self, job, summary, raw_data, low_pass_data, high_pass_data, band_pass_data):
+        return {
+            "frame_index": job["frame_index"],
+            "inferred_tacho": job["inferred_tacho"],
+            "summary": summary,
+            "raw": raw_data,
+            "low": low_pass_data,
+            "high": high_pass_data,
+            "band": band_pass_data,
+            "raw_ptp": np.ptp(raw_data, axis=-1),
+        }
+
+    def _fill_segment_summary(self, summary, freq, raw_data, band_pass_data, triggers, orders):
+        """Fill summary rows with the per-segment means of ptp and harmonics for every channel."""
+        if _frame_metrics is not None:
+            # Numba: one native pass per channel, channels run in parallel
+            bounds = np.asarray(triggers, dtype=np.int64)
+            bounds = bounds[bounds <= raw_data.shape[-1]]
+            direct_means, bandpass_means, amps, phases = _frame_metrics(raw_data, band_pass_data, bounds, orders)
+        else:
+            # Segment peak-to-peak for every channel in one pass per block
+            direct_means = self._segment_ptp_means(raw_data, triggers)
+            bandpass_means = self._segment_ptp_means(band_pass_data, triggers)
+            # Harmonics for all channels at once, one matrix product per segment
+            amps, phases = self._segment_harmonic_means(raw_data, triggers, orders)
+        # One vectorized column assignment per SUMMARY_DTYPE field
+        summary['freq'] = freq
+        summary['direct'] = direct_means
+        summary['bp'] = bandpass_means
+        summary['one_xa'] = amps[:, 0]
+        summary['one_xp'] = phases[:, 0]
+        summary['two_xa'] = amps[:, 1]
+        summary['two_xp'] = phases[:, 1]
+        summary['nxa'] = amps[:, 2]
+        summary['nxp'] = phases[:, 2]
+
+    def _segment_ptp_means(self, block, triggers):
+        """Mean peak-to-peak per row of block over trigger segments longer than one sample."""
+        bounds = np.asarray(triggers, dtype=np.intp)
+        bounds = bounds[bounds <= block.shape[-1]]
+        if bounds.size < 2:
+            return np.zeros(block.shape[0])
+        valid = np.diff(bounds) > 1
+        if not valid.any():
+            return np.zeros(block.shape[0])
+        # reduceat over [start_j, start_j+1) with the final segment ending at the last trigger
+        span = block[:, :bounds[-1]]
+        starts = bounds[:-1]
+        ptp = np.maximum.reduceat(span, starts, axis=-1) - np.minimum.reduceat(span, starts, axis=-1)
+        return ptp[:, valid].mean(axis=-1)
+
+    def _filter_block(self, filters, raw, low_out, high_out, band_out):
+        """Apply the (low, high, band) FIR taps in filters to every row of raw along the sample axis."""
+        low_taps, high_taps, band_taps = filters
+        low_out[:] = self._fir_rows(low_taps, raw)
+        high_out[:] = self._fir_rows(high_taps, raw)
+        band_out[:] = self._fir_rows(band_taps, raw)
+
+    def _fir_rows(self, taps, raw):
+        """Causal FIR of every row; long filters go through overlap-add FFT convolution.
+
+        Both branches give lfilter's output (zero initial state, first N samples of the full convolution).
+        """
+        if len(taps) >= FFT_FILTER_MIN_TAPS:
+            return signal.oaconvolve(raw, taps[np.newaxis, :], mode='full', axes=-1)[:, :raw.shape[-1]]
+        return signal.lfilter(taps, 1.0, raw, axis=-1)
+
+    def _frame_buffers(self, num_channels):
+        """Return a (raw, low, high, band) float32 buffer set the GUI is not currently showing.
+
+        Called on the GUI thread when a job is built. Of the two sets, the one whose raw array is
+        bound to self.raw_data is skipped, so the worker never overwrites the arrays on screen,
+        even after a dropped result; only one frame is ever in flight.
+        """
+        sets = self._frame_buf_sets
+        if not sets or sets[0][0].shape[0] != num_channels:
+            sets = [tuple(np.zeros((num_channels, 4096), dtype=np.float32) for _ in range(4)) for _ in range(2)]
+            self._frame_buf_sets = sets
+        return sets[1] if sets[0][0] is self.raw_data else sets[0]
+
+    def on_frame_processed(self, result):
+        """GUI-thread slot: swap in worker results, extend histories and refresh rows."""
+        self._dsp_busy = False
+        if self.data_buffer and self.table and not sip.isdeleted(self.table):
+            # A newer frame was parked while this one was in flight; run it once this slot
+            # returns, so the last frame of a paused or ended stream is still shown
+            QTimer.singleShot(0, self.process_buffered_data)
+        if result is None or not self.table or sip.isdeleted(self.table):
+            return
+        frame_index = result["frame_index"]
+        try:
+            summary = result["summary"]
+            if len(summary) != self.num_channels:
+                # Channel layout changed while the frame was in flight; drop it
+                return
+            self.summary = summary
+            self.raw_data = result["raw"]
+            self.low_pass_data = result["low"]
+            self.high_pass_data = result["high"]
+            self.band_pass_data = result["band"]
+            self.raw_ptp = result["raw_ptp"]
+            now = datetime.now()
+            timestamp = self._timestamp_text(now)
+            elapsed = (now - self.start_time).total_seconds()
+            rows = []
             for ch in range(self.num_channels):
-                self.average_frequency[ch] = tacho_freq
                 channel_name = self.channel_names[ch] if ch < len(self.channel_names) else f"Channel {ch+1}"
-                props = self.channel_properties.get(channel_name, {"Unit": "mil"})
-                unit = props["Unit"].lower()
-                self.raw_data[ch] = self.process_calibrated_data(norm_values[ch], ch)
-                # Ensure cached FIR coefficients for current rate
-                self._ensure_filters()
-                self.low_pass_data[ch] = signal.lfilter(self._low_pass_coeffs, 1.0, self.raw_data[ch])
-                self.high_pass_data[ch] = signal.lfilter(self._high_pass_coeffs, 1.0, self.raw_data[ch])
-                self.band_pass_data[ch] = signal.lfilter(self._band_pass_coeffs, 1.0, self.raw_data[ch])
-
-                # Segment-based calculations between triggers
-                direct_ptps, bandpass_ptps = [], []
-                one_x_amps_list, one_x_phases_list = [], []
-                two_x_amps_list, two_x_phases_list = [], []
-                nx_amp_list, nx_phase_list = [], []
-                for j in range(len(triggers) - 1):
-                    start = triggers[j]
-                    end = triggers[j + 1]
-                    seg_len = end - start
-                    if seg_len <= 1:
-                        continue
-                    seg_raw = self.raw_data[ch][start:end]
-                    direct_ptps.append(np.max(seg_raw) - np.min(seg_raw))
-                    seg_band = self.band_pass_data[ch][start:end]
-                    bandpass_ptps.append(np.max(seg_band) - np.min(seg_band))
-                    amp1, phase1 = self.compute_harmonics(self.raw_data[ch], start, seg_len, 1)
-                    one_x_amps_list.append(amp1)
-                    one_x_phases_list.append(phase1)
-                    amp2, phase2 = self.compute_harmonics(self.raw_data[ch], start, seg_len, 2)
-                    two_x_amps_list.append(amp2)
-                    two_x_phases_list.append(phase2)
-                    # NX selection (single)
-                    try:
-                        n = float(self.nx_selection)
-                    except Exception:
-                        n = 3.0
-                    aN, _ = self.compute_harmonics(self.raw_data[ch], start, seg_len, n)
-                    _, pN = self.compute_harmonics(self.raw_data[ch], start, seg_len, n)
-                    nx_amp_list.append(aN); nx_phase_list.append(pN)
-
-                avg_direct = float(np.mean(direct_ptps)) if direct_ptps else 0.0
-                avg_bandpass = float(np.mean(bandpass_ptps)) if bandpass_ptps else 0.0
-                avg_1xa = float(np.mean(one_x_amps_list)) if one_x_amps_list else 0.0
-                avg_1xp = float(np.mean(one_x_phases_list)) if one_x_phases_list else 0.0
-                avg_2xa = float(np.mean(two_x_amps_list)) if two_x_amps_list else 0.0
-                avg_2xp = float(np.mean(two_x_phases_list)) if two_x_phases_list else 0.0
-                avg_nxa = float(np.mean(nx_amp_list)) if nx_amp_list else 0.0
-                avg_nxp = float(np.mean(nx_phase_list)) if nx_phase_list else 0.0
-
-                self.band_pass_peak_to_peak[ch] = avg_bandpass
+                fmt = self._unit_fmts[ch]
+                tacho_freq, avg_direct, avg_bandpass, avg_1xa, avg_1xp, avg_2xa, avg_2xp, avg_nxa, avg_nxp = (float(v) for v in summary[ch])
+
                 self.band_pass_peak_to_peak_history[ch].append(avg_bandpass)
-                self.band_pass_peak_to_peak_times[ch].append((datetime.now() - self.start_time).total_seconds())
-                if len(self.band_pass_peak_to_peak_history[ch]) > 50:
-                    self.band_pass_peak_to_peak_history[ch] = self.band_pass_peak_to_peak_history[ch][-50:]
-                    self.band_pass_peak_to_peak_times[ch] = self.band_pass_peak_to_peak_times[ch][-50:]
+                self.band_pass_peak_to_peak_times[ch].append(elapsed)
 
                 self.one_x_amps[ch].append(avg_1xa)
                 self.one_x_phases[ch].append(avg_1xp)
                 self.two_x_amps[ch].append(avg_2xa)
                 self.two_x_phases[ch].append(avg_2xp)
                 self.nx_amps[ch].append(avg_nxa); self.nx_phases[ch].append(avg_nxp)
-                if len(self.one_x_amps[ch]) > 50:
-                    self.one_x_amps[ch] = self.one_x_amps[ch][-50:]
-                    self.one_x_phases[ch] = self.one_x_phases[ch][-50:]
-                    self.two_x_amps[ch] = self.two_x_amps[ch][-50:]
-                    self.two_x_phases[ch] = self.two_x_phases[ch][-50:]
-                    self.nx_amps[ch] = self.nx_amps[ch][-50:]
-                    self.nx_phases[ch] = self.nx_phases[ch][-50:]
 
                 channel_data = {
                     "Channel Name": channel_name,
-                    "Unit": self._format_unit_display(channel_name),
-                    "DateTime": datetime.now().strftime("%d-%b-%Y %I:%M:%S %p"),
-                    "RPM": f"{int(round(self.average_frequency[ch] * 60.0))}" if self.average_frequency[ch] > 0 else "0",
+                    "Unit": self._unit_labels[ch],
+                    "DateTime": timestamp,
+                    "RPM": f"{int(round(tacho_freq * 60.0))}" if tacho_freq > 0 else "0",
                     "Gap": (f"{float(self.gap_voltages[ch]):.2f}" if isinstance(self.gap_voltages, (list, tuple)) and ch < len(self.gap_voltages) and self.gap_voltages[ch] is not None else "0.00"),
-                    "Direct": self.format_direct_bandpass_value(avg_direct, unit),
-                    "Bandpass": self.format_direct_bandpass_value(avg_bandpass, unit),
-                    "1xAmp": self.format_direct_value([avg_1xa], unit),
+                    "Direct": fmt.format(avg_direct),
+                    "Bandpass": fmt.format(avg_bandpass),
+                    "1xAmp": fmt.format(avg_1xa),
                     "1xPhase": f"{avg_1xp:.0f}°",
-                    "2xAmp": self.format_direct_value([avg_2xa], unit),
+                    "2xAmp": fmt.format(avg_2xa),
                     "2xPhase": f"{avg_2xp:.0f}°",
-                    "NXAmp": self.format_direct_value([avg_nxa], unit),
+                    "NXAmp": fmt.format(avg_nxa),
                     "NXPhase": f"{avg_nxp:.0f}°"
                 }
-                self.update_table_row(ch, channel_data)
+                rows.append(channel_data)
+            self.update_table_rows(rows)
             QTimer.singleShot(0, self.update_plots)
-            if self.console and (datetime.now() - self._last_log_time).total_seconds() >= self._log_interval_sec:
-                self.console.append_to_console(f"Processed buffered data for frame {frame_index}, mains={self.num_channels}, tacho={inferred_tacho}")
-                self._last_log_time = datetime.now()
+            if self.console and (now - self._last_log_time).total_seconds() >= self._log_interval_sec:
+                self.console.append_to_console(f"Processed buffered data for frame {frame_index}, mains={self.num_channels}, tacho={result['inferred_tacho']}")
+                self._last_log_time = now
         except Exception as ex:
-            self.log_and_set_status(f"Error processing buffered data for frame {frame_index}: {str(ex)}")
+            self.log_and_set_status(f"Error applying processed data for frame {frame_index}: {str(ex)}")
 
     def _ensure_filters(self):
-        """Compute and cache FIR coefficients for the current sample rate."""
+        """Compute and cache FIR coefficients for the current sample rate (GUI thread only)."""
         try:
             if self._last_filter_rate == self.sample_rate and self._low_pass_coeffs is not None:
                 return
             nyquist = max(1.0, float(self.sample_rate) / 2.0)
             tap_num = 31
             band = [50 / nyquist, 200 / nyquist]
-            # Cache coefficients
-            self._low_pass_coeffs = signal.firwin(tap_num, 20 / nyquist, window='hamming')
-            self._high_pass_coeffs = signal.firwin(tap_num, 200 / nyquist, window='hamming', pass_zero=False)
-            self._band_pass_coeffs = signal.firwin(tap_num, band, window='hamming', pass_zero=False)
+            # Cache coefficients as float32 so filtering the float32 blocks stays in float32
+            self._low_pass_coeffs = signal.firwin(tap_num, 20 / nyquist, window='hamming').astype(np.float32)
+            self._high_pass_coeffs = signal.firwin(tap_num, 200 / nyquist, window='hamming', pass_zero=False).astype(np.float32)
+            self._band_pass_coeffs = signal.firwin(tap_num, band, window='hamming', pass_zero=False).astype(np.float32)
             self._last_filter_rate = self.sample_rate
         except Exception as ex:
             self.log_and_set_status(f"Error computing filter coefficients: {str(ex)}")
@@ -1296,22 +1724,19 @@ class TabularViewFeature:
             expected_main = max(1, len(self.channel_names))
             if self.table:
                 self.num_channels = expected_main
-                self.table.setRowCount(self.num_channels)
+                self.model.resize_rows(self.num_channels)
             self.initialize_data_arrays()
             self.update_table_defaults()
 
-            # Normalize incoming values to expected_main channels and 4096 samples
-            norm_values = []
-            for i in range(expected_main):
-                if i < len(values) and isinstance(values[i], (list, np.ndarray)) and len(values[i]) > 0:
-                    v = values[i]
-                else:
-                    v = [0.0] * 4096
-                if len(v) < 4096:
-                    v = list(np.pad(v, (0, 4096 - len(v)), 'constant'))[:4096]
-                elif len(v) > 4096:
-                    v = v[:4096]
-                norm_values.append(v)
+            # Normalize incoming values into a zeroed (expected_main, 4096) float32 block:
+            # missing channels stay zero, short channels are zero-padded, long ones truncated.
+            # A fresh block rather than _data_buf, since a live frame may still be on the worker.
+            norm_values = np.zeros((expected_main, 4096), dtype=np.float32)
+            for i in range(min(expected_main, len(values))):
+                v = values[i]
+                if isinstance(v, (list, np.ndarray)):
+                    n = min(len(v), 4096)
+                    norm_values[i, :n] = v[:n]
 
             self.sample_rate = Fs if Fs > 0 else self.sample_rate
 
@@ -1321,7 +1746,7 @@ class TabularViewFeature:
                 inferred_tacho = 2
             trigger_index = self.num_channels + 1 if inferred_tacho >= 2 else (self.num_channels if inferred_tacho >= 1 else None)
             trigger_data = values[trigger_index] if trigger_index is not None and len(values) > trigger_index else []
-            triggers = self.get_trigger_indices(trigger_data) if len(trigger_data) > 0 else [0, 1024, 2048, 3072]
+            triggers = self.get_trigger_indices(trigger_data) if len(trigger_data) > 0 else DEFAULT_TRIGGERS
 
             # Compute per-channel metrics
             # Prefer direct frequency channel if present; fallback to trigger-based estimation
@@ -1329,76 +1754,40 @@ class TabularViewFeature:
             try:
                 freq_ch_idx = self.num_channels if inferred_tacho >= 1 else None
                 if freq_ch_idx is not None and len(values) > freq_ch_idx and len(values[freq_ch_idx]) > 0:
-                    fvals = np.array(values[freq_ch_idx], dtype=float)
-                    fvals = fvals[np.isfinite(fvals) & (fvals > 0)]
-                    if fvals.size > 0:
-                        # Frequency arrives scaled x100; convert back to Hz
-                        freq_from_channel = float(np.mean(fvals)) / 100.0
+                    freq_from_channel = self._frequency_channel_hz(values[freq_ch_idx])
             except Exception:
                 pass
-            trig_based_freq = 0.0
-            if len(triggers) >= 2:
-                diffs = np.diff(triggers)
-                if len(diffs) > 0 and np.mean(diffs) > 0:
-                    trig_based_freq = float(self.sample_rate) / float(np.mean(diffs))
+            trig_based_freq = self._trigger_frequency_hz(triggers, self.sample_rate)
 
+            frame_freq = freq_from_channel if freq_from_channel > 0.0 else trig_based_freq
+            # NX selection (single)
+            try:
+                n = float(self.nx_selection)
+            except Exception:
+                n = 3.0
+            orders = np.array([1.0, 2.0, n])
+            # Same taps as the live path, designed once per sample rate
+            self._ensure_filters()
             for ch in range(self.num_channels):
-                self.average_frequency[ch] = freq_from_channel if freq_from_channel > 0.0 else trig_based_freq
-
                 self.raw_data[ch] = self.process_calibrated_data(norm_values[ch], ch)
-                nyquist = self.sample_rate / 2.0
-                tap_num = 31
-                low_pass_coeffs = signal.firwin(tap_num, 20 / nyquist, window='hamming')
-                high_pass_coeffs = signal.firwin(tap_num, 200 / nyquist, window='hamming', pass_zero=False)
-                # Fixed bandpass as per spec (removed selection UI)
-                band = [50 / nyquist, 200 / nyquist]
-                band_pass_coeffs = signal.firwin(tap_num, band, window='hamming', pass_zero=False)
-
-                self.low_pass_data[ch] = signal.lfilter(low_pass_coeffs, 1.0, self.raw_data[ch])
-                self.high_pass_data[ch] = signal.lfilter(high_pass_coeffs, 1.0, self.raw_data[ch])
-                self.band_pass_data[ch] = signal.lfilter(band_pass_coeffs, 1.0, self.raw_data[ch])
-
-                # Segment computations
-                direct_ptps, bandpass_ptps = [], []
-                one_x_amps_list, one_x_phases_list = [], []
-                two_x_amps_list, two_x_phases_list = [], []
-                nx1_amp_list, nx1_phase_list = [], []
-                nx2_amp_list, nx2_phase_list = [], []
-                nx3_amp_list, nx3_phase_list = [], []
-                for j in range(len(triggers) - 1):
-                    start = triggers[j]
-                    end = triggers[j + 1]
-                    seg_len = end - start
-                    if seg_len <= 1:
-                        continue
-                    seg_raw = self.raw_data[ch][start:end]
-                    direct_ptps.append(float(np.max(seg_raw) - np.min(seg_raw)))
-                    seg_band = self.band_pass_data[ch][start:end]
-                    bandpass_ptps.append(float(np.max(seg_band) - np.min(seg_band)))
-                    amp1, phase1 = self.compute_harmonics(self.raw_data[ch], start, seg_len, 1)
-                    one_x_amps_list.append(amp1); one_x_phases_list.append(phase1)
-                    amp2, phase2 = self.compute_harmonics(self.raw_data[ch], start, seg_len, 2)
-                    two_x_amps_list.append(amp2); two_x_phases_list.append(phase2)
-                    # NX selection (single)
-                    try:
-                        n = float(self.nx_selection)
-                    except Exception:
-                        n = 3.0
-                    aN, _ = self.compute_harmonics(self.raw_data[ch], start, seg_len, n)
-                    _, pN = self.compute_harmonics(self.raw_data[ch], start, seg_len, n)
-                    nx_amp_list.append(aN); nx_phase_list.append(pN)
-
-                # Assign single-frame stats
-                self.band_pass_peak_to_peak[ch] = float(np.mean(bandpass_ptps)) if bandpass_ptps else 0.0
-                self.band_pass_peak_to_peak_history[ch] = [self.band_pass_peak_to_peak[ch]]
-                self.band_pass_peak_to_peak_times[ch] = [0.0]
-                self.one_x_amps[ch] = [float(np.mean(one_x_amps_list)) if one_x_amps_list else 0.0]
-                self.one_x_phases[ch] = [float(np.mean(one_x_phases_list)) if one_x_phases_list else 0.0]
-                self.two_x_amps[ch] = [float(np.mean(two_x_amps_list)) if two_x_amps_list else 0.0]
-                self.two_x_phases[ch] = [float(np.mean(two_x_phases_list)) if two_x_phases_list else 0.0]
+            # Filter all channels at once, one call per band
+            self._filter_block((self._low_pass_coeffs, self._high_pass_coeffs, self._band_pass_coeffs),
+                               self.raw_data, self.low_pass_data, self.high_pass_data, self.band_pass_data)
+            self.raw_ptp = np.ptp(self.raw_data, axis=-1)
+
+            # Single-frame stats: native kernel when numba is available, vectorized NumPy otherwise
+            self._fill_segment_summary(self.summary, frame_freq, self.raw_data, self.band_pass_data, triggers, orders)
+            for ch in range(self.num_channels):
+                row = self.summary[ch]
+                self.band_pass_peak_to_peak_history[ch] = deque([float(row['bp'])], maxlen=HISTORY_LEN)
+                self.band_pass_peak_to_peak_times[ch] = deque([0.0], maxlen=HISTORY_LEN)
+                self.one_x_amps[ch] = deque([float(row['one_xa'])], maxlen=HISTORY_LEN)
+                self.one_x_phases[ch] = deque([float(row['one_xp'])], maxlen=HISTORY_LEN)
+                self.two_x_amps[ch] = deque([float(row['two_xa'])], maxlen=HISTORY_LEN)
+                self.two_x_phases[ch] = deque([float(row['two_xp'])], maxlen=HISTORY_LEN)
                 # Store NX stats (single)
-                self.nx_amps[ch] = [float(np.mean(nx_amp_list)) if nx_amp_list else 0.0]
-                self.nx_phases[ch] = [float(np.mean(nx_phase_list)) if nx_phase_list else 0.0]
+                self.nx_amps[ch] = deque([float(row['nxa'])], maxlen=HISTORY_LEN)
+                self.nx_phases[ch] = deque([float(row['nxp'])], maxlen=HISTORY_LEN)
 
             # Update UI from this single selection
             self.update_display()
@@ -1415,26 +1804,13 @@ class TabularViewFeature:
         if sip.isdeleted(self.table):
             self.log_and_set_status("Table widget deleted, skipping update_table_row")
             return
-        headers = list(self.internal_headers)
         try:
-            for col, internal in enumerate(headers):
-                text = channel_data[internal]
-                item = self.table.item(row, col)
-                if item is None:
-                    # Create once and keep reusing to minimize allocations per frame
-                    item = QTableWidgetItem(text)
-                    item.setTextAlignment(Qt.AlignCenter)
-                    bold_font = QFont("Times New Roman", 10)
-                    bold_font.setBold(True)
-                    item.setFont(bold_font)
-                    self.table.setItem(row, col, item)
-                else:
-                    # Only update if text changed to reduce unnecessary repaints
-                    if item.text() != text:
-                        item.setText(text)
+            if row >= self.model.total_rows():
+                # Rows not built yet (e.g. before defaults were applied)
+                self.update_table_defaults()
+            # Model only emits dataChanged for cells whose text actually changed
+            self.model.update_row(row, [channel_data[internal] for internal in self.internal_headers])
             logging.debug(f"Updated table row {row} with unit: {channel_data['Unit']}")
-            # After updating a row, ensure sizing stays correct
-            self.table.resizeRowToContents(row)
             # Keep column widths accurate but throttled
             try:
                 self._maybe_resize_columns()
@@ -1443,6 +1819,24 @@ class TabularViewFeature:
         except Exception as ex:
             self.log_and_set_status(f"Error updating table row {row}: {str(ex)}")
 
+    def update_table_rows(self, rows):
+        """Commit channel_data dicts for rows 0..len(rows)-1 as one model update."""
+        if not self.table or not self.table_initialized or sip.isdeleted(self.table):
+            return
+        try:
+            if len(rows) > self.model.total_rows():
+                self.update_table_defaults()
+            cells = np.empty((len(rows), len(self.internal_headers)), dtype=object)
+            for r, channel_data in enumerate(rows):
+                cells[r] = [channel_data[internal] for internal in self.internal_headers]
+            self.model.update_rows(cells)
+            try:
+                self._maybe_resize_columns()
+            except Exception:
+                pass
+        except Exception as ex:
+            self.log_and_set_status(f"Error updating table rows: {str(ex)}")
+
     def update_display(self):
         if not self.table or not self.table_initialized:
             self.log_and_set_status("Table not initialized, skipping update_display")
@@ -1472,33 +1866,20 @@ class TabularViewFeature:
 
     def _apply_fixed_column_widths(self):
         """Set fixed resize mode and width for all columns to prevent jumping, based on
-        both header labels and current cell contents (sampled rows)."""
+        header labels and the static per-column width hints."""
         if not self.table or sip.isdeleted(self.table):
             return
         try:
             header = self.table.horizontalHeader()
-            # Estimate width based on a representative max string
-            # Use header labels as baseline (header font) and cell contents using item font
-            from PyQt5.QtGui import QFontMetrics
+            # Header labels (header font) set the baseline; cell formats are known, so use hints
             header_metrics = QFontMetrics(header.font())
-            # Use table's font (same applied to items) for cell width computations
-            item_metrics = QFontMetrics(self.table.font())
             padding = 42  # extra padding to avoid cramped look
             labels = self.get_display_headers()
             for i, label in enumerate(labels):
                 try:
-                    # Start with header label width
                     w = self._text_width(header_metrics, label) + padding
-                    # Consider current cell contents: sample all rows for widest text
-                    sample_rows = self.table.rowCount()
-                    for r in range(sample_rows):
-                        it = self.table.item(r, i)
-                        if it is not None:
-                            tw = self._text_width(item_metrics, it.text()) + padding
-                            if tw > w:
-                                w = tw
                     # No artificial caps: allow horizontal scroll if total width is large
-                    w = max(110, w)
+                    w = max(110, self._col_widths.get(self.internal_headers[i], 110), w)
                     header.setSectionResizeMode(i, QHeaderView.Fixed)
                     self.table.setColumnWidth(i, w)
                 except Exception:
@@ -1524,49 +1905,63 @@ class TabularViewFeature:
         except Exception:
             pass
 
+    def _timestamp_text(self, now):
+        """DateTime cell text for all rows; skipped entirely while the column is hidden."""
+        if not self.column_visibility.get("DateTime", True):
+            return ""
+        key = now.replace(microsecond=0)
+        if key != self._timestamp_key:
+            self._timestamp_key = key
+            self._timestamp_cache = now.strftime("%d-%b-%Y %I:%M:%S %p")
+        return self._timestamp_cache
+
     def _render_table_from_state(self):
         """Populate all table rows from current cached arrays and properties.
         Safe for both streaming and single-frame selection states.
         """
-        headers = list(self.internal_headers)
-        now_str = datetime.now().strftime("%d-%b-%Y %I:%M:%S %p")
-        for ch in range(self.num_channels):
+        now_str = self._timestamp_text(datetime.now())
+        summary = self.summary
+        rows = []
+        for ch in range(min(self.num_channels, len(summary))):
             try:
                 channel_name = self.channel_names[ch] if ch < len(self.channel_names) else f"Channel {ch+1}"
-                props = self.channel_properties.get(channel_name, {"Unit": "mil"})
-                unit = (props.get("Unit", "mil") or "mil").lower()
-                subunit = (props.get("Subunit") or "pp").lower()
-                # Compute direct and bandpass from cached arrays
-                direct_ptp = float(np.ptp(self.raw_data[ch])) if isinstance(self.raw_data[ch], np.ndarray) and self.raw_data[ch].size > 0 else 0.0
-                direct_val = self._convert_ptp_by_subunit(direct_ptp, subunit)
-                bandpass_ptp = float(self.band_pass_peak_to_peak[ch]) if ch < len(self.band_pass_peak_to_peak) else 0.0
-                bandpass_val = self._convert_ptp_by_subunit(bandpass_ptp, subunit)
-                # Harmonics: use last values if available
-                one_xa = float(self.one_x_amps[ch][-1]) if self.one_x_amps[ch] else 0.0
-                one_xp = float(self.one_x_phases[ch][-1]) if self.one_x_phases[ch] else 0.0
-                two_xa = float(self.two_x_amps[ch][-1]) if self.two_x_amps[ch] else 0.0
-                two_xp = float(self.two_x_phases[ch][-1]) if self.two_x_phases[ch] else 0.0
-                nxa = float(self.nx_amps[ch][-1]) if self.nx_amps[ch] else 0.0
-                nxp = float(self.nx_phases[ch][-1]) if self.nx_phases[ch] else 0.0
+                fmt = self._unit_fmts[ch]
+                ptp_factor = self._ptp_factors[ch]
+                # Direct from the ptp cached with raw_data; bandpass from the summary
+                direct_ptp = float(self.raw_ptp[ch]) if ch < len(self.raw_ptp) else 0.0
+                direct_val = direct_ptp * ptp_factor
+                row = summary[ch]
+                freq = float(row['freq'])
+                bandpass_val = float(row['bp']) * ptp_factor
+                # Harmonics: latest values from the summary block
+                one_xa = float(row['one_xa'])
+                one_xp = float(row['one_xp'])
+                two_xa = float(row['two_xa'])
+                two_xp = float(row['two_xp'])
+                nxa = float(row['nxa'])
+                nxp = float(row['nxp'])
                 # Build row data
                 channel_data = {
                     "Channel Name": channel_name,
-                    "Unit": self._format_unit_display(channel_name),
+                    "Unit": self._unit_labels[ch],
                     "DateTime": now_str,
-                    "RPM": f"{int(round(self.average_frequency[ch] * 60.0))}" if self.average_frequency[ch] > 0 else "0",
+                    "RPM": f"{int(round(freq * 60.0))}" if freq > 0 else "0",
                     "Gap": (f"{float(self.gap_voltages[ch]):.2f}" if isinstance(self.gap_voltages, (list, tuple)) and ch < len(self.gap_voltages) and self.gap_voltages[ch] is not None else "0.00"),
-                    "Direct": self.format_direct_bandpass_value(direct_val, unit),
-                    "Bandpass": self.format_direct_bandpass_value(bandpass_val, unit),
-                    "1xAmp": self.format_direct_value([one_xa], unit),
+                    "Direct": fmt.format(direct_val),
+                    "Bandpass": fmt.format(bandpass_val),
+                    "1xAmp": fmt.format(one_xa),
                     "1xPhase": f"{one_xp:.0f}°",
-                    "2xAmp": self.format_direct_value([two_xa], unit),
+                    "2xAmp": fmt.format(two_xa),
                     "2xPhase": f"{two_xp:.0f}°",
-                    "NXAmp": self.format_direct_value([nxa], unit),
+                    "NXAmp": fmt.format(nxa),
                     "NXPhase": f"{nxp:.0f}°",
                 }
-                self.update_table_row(ch, channel_data)
+                rows.append(channel_data)
             except Exception as ex:
+                # Rows are committed as one contiguous block; keep what rendered so far
                 self.log_and_set_status(f"Error rendering row {ch}: {str(ex)}")
+                break
+        self.update_table_rows(rows)
 
     def update_plots(self):
         if not self.plots_enabled:
@@ -1603,20 +1998,25 @@ class TabularViewFeature:
                     time_data = self.time_points[:len(data)]
                 if i < len(self.plots):
                     self.plots[i].setData(time_data, data)
-                    self.plot_widgets[i].setTitle(f"{title} (Channel: {self.channel_names[ch]}, Freq: {self.average_frequency[ch]:.2f} Hz, Unit: {unit})")
-                    y_min = np.min(data) * 1.1 if data.size > 0 else -1.0
-                    y_max = np.max(data) * 1.1 if data.size > 0 else 1.0
+                    self.plot_widgets[i].setTitle(f"{title} (Channel: {self.channel_names[ch]}, Freq: {float(self.summary['freq'][ch]):.2f} Hz, Unit: {unit})")
+                    if data.size > 0:
+                        lo, hi = _minmax(data) if _minmax is not None else (data.min(), data.max())
+                        y_min, y_max = float(lo) * 1.1, float(hi) * 1.1
+                    else:
+                        y_min, y_max = -1.0, 1.0
                     self.plot_widgets[i].setYRange(y_min, y_max, padding=0.1)
             except Exception as ex:
                 self.log_and_set_status(f"Error updating plot {i}: {str(ex)}")
         try:
             if self.band_pass_peak_to_peak_times[ch] and self.band_pass_peak_to_peak_history[ch]:
-                peak_data = np.array(self.band_pass_peak_to_peak_history[ch])
+                history = self.band_pass_peak_to_peak_history[ch]
+                times = self.band_pass_peak_to_peak_times[ch]
+                peak_data = np.fromiter(history, dtype=np.float32, count=len(history))
                 if unit == "mm":
                     peak_data /= 25.4
                 elif unit == "um":
                     peak_data *= 25.4 * 1000
-                self.plots[4].setData(self.band_pass_peak_to_peak_times[ch], peak_data)
+                self.plots[4].setData(np.fromiter(times, dtype=float, count=len(times)), peak_data)
                 y_max = max(0.01, np.max(peak_data) * 1.1) if peak_data.size > 0 else 0.01
                 self.plot_widgets[4].setYRange(0, y_max, padding=0.1)
             else:
@@ -1648,7 +2048,7 @@ class TabularViewFeature:
                     "Gain": float(channel.get("gain", "1.0")) if channel.get("gain") else 1.0,
                     "Sensitivity": float(channel.get("sensitivity", "1.0")) if channel.get("sensitivity") else 1.0
                 }
-            self.table.setRowCount(self.num_channels)
+            self.model.resize_rows(self.num_channels)
             self.initialize_data_arrays()
             self.update_table_defaults()
             self.load_settings_from_database()
@@ -1664,7 +2064,8 @@ class TabularViewFeature:
 
     def close(self):
         self.timer.stop()
-        if hasattr(self, 'thread') and self.thread.isRunning():
+        self.gap_timer.stop()
+        if hasattr(self, 'thread') and not sip.isdeleted(self.thread) and self.thread.isRunning():
             self.thread.quit()
             self.thread.wait()
         for widget in self.plot_widgets:
@@ -1675,6 +2076,7 @@ class TabularViewFeature:
         if self.table:
             self.table.deleteLater()
             self.table = None
+            self.model = None
             self.table_initialized = False
         if self.widget:
             self.widget.deleteLater()
@@ -1693,7 +2095,13 @@ class TabularViewFeature:
                 return
             # Store as floats; may be longer than channel count; we index by channel index when using
             self.gap_voltages = [float(x) if x is not None else None for x in gaps]
-            # Trigger a non-blocking UI refresh so Gap column updates
-            QTimer.singleShot(0, self.update_display)
+            # Gap column is refreshed by gap_timer on its next tick
+            self._gaps_dirty = True
         except Exception as ex:
-            self.log_and_set_status(f"Error setting gap voltages: {str(ex)}")
\ No newline at end of file
+            self.log_and_set_status(f"Error setting gap voltages: {str(ex)}")
+
+    def _refresh_if_gaps_dirty(self):
+        if not self._gaps_dirty:
+            return
+        self._gaps_dirty = False
+        self.update_display()
\ No newline at end of file
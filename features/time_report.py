@@ -1,24 +1,64 @@
 # time_report.py
 import asyncio
+import bisect
 import platform
 import logging
 import math
 import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel, QPushButton,
-    QScrollArea, QDateTimeEdit, QGridLayout, QProgressDialog, QApplication, QMessageBox
+    QScrollArea, QDateTimeEdit, QGridLayout, QMessageBox
 )
 from PyQt5.QtCore import (
-    Qt, QDateTime, QRect, pyqtSignal, QEvent, QObject, QTimer
+    Qt, QDateTime, QRect, pyqtSignal, QEvent, QObject, QTimer, QThread
 )
 from PyQt5.QtGui import QPainter, QPen, QBrush, QColor
 import pyqtgraph as pg
 from pyqtgraph import PlotWidget, mkPen, AxisItem, InfiniteLine, SignalProxy
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; _load_history falls back to a NumPy transpose
+    njit = None
+    prange = range
+
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Trigger marker buckets follow the widest plot's pixel width (one marker at most per pixel);
+# floor for plots that are not laid out yet
+MIN_PLOT_BUCKETS = 500
+
+# Accepted types for samplingRate and the message payload; the validation compares type() against
+# these first (pointer compare) and only falls back to isinstance for subclasses (bool, numpy scalars)
+_NUM_TYPES = (int, float)
+_SEQ_TYPES = (list, np.ndarray)
+# Hashed twins for the exact-type membership tests (isinstance itself needs the tuples)
+_NUM_TYPE_SET = frozenset(_NUM_TYPES)
+_SEQ_TYPE_SET = frozenset(_SEQ_TYPES)
+
+
+def _pack_counts_loops(stacked, out, fits):
+    """Copy (messages, channels, samples) integer counts into the (channels, messages * samples) uint16 block.
+
+    One pass does the range check, the transpose and the narrowing; fits[c] is cleared when
+    channel c has a value outside 0..65535 (out is then unusable). Channels run in parallel.
+    """
+    num_msgs, channels, samples = stacked.shape
+    for c in prange(channels):
+        for m in range(num_msgs):
+            base = m * samples
+            for i in range(samples):
+                v = stacked[m, c, i]
+                if v < 0 or v > 65535:
+                    fits[c] = False
+                out[c, base + i] = v
+
+
+_pack_counts = njit(cache=True, parallel=True, nogil=True)(_pack_counts_loops) if njit is not None else None
+
 class QRangeSlider(QWidget):
     """Custom dual slider widget for selecting a time range."""
     valueChanged = pyqtSignal()
@@ -32,17 +72,33 @@ class QRangeSlider(QWidget):
         self.max_value = 1000
         self.left_value = 0
         self.right_value = 1000
+        self._scale = 0.0 # pixels per value unit, see _update_scale
         self.dragging = None
         self.setMouseTracking(True)
         self.setStyleSheet("background-color: #ebeef2;")
+        # Drags emit valueChanged at most once per frame (~16 ms) instead of on every mouse move
+        self._coalesce = QTimer(self)
+        self._coalesce.setSingleShot(True)
+        self._coalesce.setInterval(16)
+        self._coalesce.timeout.connect(self._emit_value_changed)
 
     def setRange(self, min_val, max_val):
         self.min_value = min_val
         self.max_value = max_val
         self.left_value = max(self.min_value, min(self.left_value, self.max_value))
         self.right_value = max(self.left_value + 1, min(self.right_value, self.max_value))
+        self._update_scale()
         self.update()
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scale()
+
+    def _update_scale(self):
+        """Value-to-pixel factor of the groove; only width and range change it, not paints or drags."""
+        span = self.max_value - self.min_value
+        self._scale = (self.width() - 20) / span if span else 0.0
+
     def setValues(self, left, right):
         self.left_value = max(self.min_value, min(left, self.max_value))
         self.right_value = max(self.left_value + 1, min(right, self.max_value))
@@ -70,29 +126,25 @@ class QRangeSlider(QWidget):
         painter.setBrush(QColor("#42a5f5" if self.dragging == 'right' else "#1a73e8"))
         painter.drawEllipse(right_pos - handle_radius, 18 - (handle_radius - 4), handle_size, handle_size)
 
-        # Draw human-readable time labels above handles
+        # Draw human-readable time labels above handles (cached per whole second; drags repaint constantly)
         try:
-            left_dt = datetime.fromtimestamp(float(self.left_value)) if isinstance(self.left_value, (int, float)) else None
-            right_dt = datetime.fromtimestamp(float(self.right_value)) if isinstance(self.right_value, (int, float)) else None
             painter.setPen(QPen(QColor("#0d47a1")))
-            if left_dt is not None:
-                left_text = left_dt.strftime('%Y-%m-%d %H:%M:%S')
+            if isinstance(self.left_value, (int, float)):
+                left_text = _format_slider_timestamp(int(self.left_value))
                 painter.drawText(max(4, left_pos - 100), 12, 200, 16, Qt.AlignHCenter | Qt.AlignVCenter, left_text)
-            if right_dt is not None:
-                right_text = right_dt.strftime('%Y-%m-%d %H:%M:%S')
+            if isinstance(self.right_value, (int, float)):
+                right_text = _format_slider_timestamp(int(self.right_value))
                 painter.drawText(max(4, right_pos - 100), 12, 200, 16, Qt.AlignHCenter | Qt.AlignVCenter, right_text)
         except Exception:
             pass
 
     def _value_to_pos(self, value):
-        if self.max_value == self.min_value:
-            return 10
-        return 10 + (self.width() - 20) * (value - self.min_value) / (self.max_value - self.min_value)
+        return 10 + (value - self.min_value) * self._scale
 
     def _pos_to_value(self, pos):
-        if self.width() <= 20:
+        if self._scale <= 0:
             return self.min_value
-        value = self.min_value + (pos - 10) / (self.width() - 20) * (self.max_value - self.min_value)
+        value = self.min_value + (pos - 10) / self._scale
         return max(self.min_value, min(self.max_value, value))
 
     def mousePressEvent(self, event):
@@ -115,15 +167,57 @@ class QRangeSlider(QWidget):
             elif self.dragging == 'right':
                 self.right_value = max(self.left_value + 1, min(value, self.max_value))
             self.update()
-            self.valueChanged.emit()
+            if not self._coalesce.isActive():
+                self._coalesce.start()
 
     def mouseReleaseEvent(self, event):
         self.dragging = None
+        # Deliver the final position of the drag right away
+        if self._coalesce.isActive():
+            self._coalesce.stop()
+            self._emit_value_changed()
         self.update()
 
+    def _emit_value_changed(self):
+        self.valueChanged.emit()
+
     def getValues(self):
         return self.left_value, self.right_value
 
+def _created_at_timestamps(messages):
+    """POSIX seconds (float64 array) for each message's ISO-8601 'createdAt', in message order.
+
+    UTC strings ('...Z', the normal case) are parsed in one datetime64 conversion; anything
+    else falls back to datetime.fromisoformat per message so offsets/naive values keep their meaning.
+    """
+    created = [m['createdAt'] for m in messages]
+    if all(isinstance(c, str) and c.endswith('Z') for c in created):
+        try:
+            stamps = np.array([c[:-1] for c in created], dtype='datetime64[us]')
+            return stamps.astype(np.int64) / 1e6
+        except ValueError:
+            pass
+    return np.fromiter((datetime.fromisoformat(c.replace('Z', '+00:00')).timestamp() for c in created),
+                       dtype=np.float64, count=len(created))
+
+
+def _fits_uint16(counts):
+    """True when an array of ADC counts can be stored as uint16 without loss."""
+    return np.issubdtype(counts.dtype, np.integer) and counts.min() >= 0 and counts.max() <= 65535
+
+
+@lru_cache(maxsize=256)
+def _format_tick_timestamp(seconds):
+    """Axis label for a whole-second timestamp; ticks repeat across repaints, pans and plots."""
+    return datetime.fromtimestamp(seconds).strftime('%Y-%m-%d\n%H:%M:%S')
+
+
+@lru_cache(maxsize=256)
+def _format_slider_timestamp(seconds):
+    """Handle label for a whole-second slider value."""
+    return datetime.fromtimestamp(seconds).strftime('%Y-%m-%d %H:%M:%S')
+
+
 class TimeAxisItem(pg.AxisItem):
     """Custom axis to display datetime on x-axis."""
     def __init__(self, *args, **kwargs):
@@ -134,8 +228,8 @@ class TimeAxisItem(pg.AxisItem):
         for v in values:
             try:
                 if isinstance(v, (int, float)) and v > 0:
-                    dt = datetime.fromtimestamp(v)
-                    result.append(dt.strftime('%Y-%m-%d\n%H:%M:%S'))
+                    # Labels only show whole seconds, so quantize before the cached lookup
+                    result.append(_format_tick_timestamp(int(v)))
                 else:
                     result.append("")
             except (ValueError, OSError, OverflowError) as e:
@@ -157,6 +251,42 @@ class MouseTracker(QObject):
             self.feature.mouse_leave(self.idx)
         return False
 
+class _ViewportWatcher(QObject):
+    """Event filter on the plot scroll viewport: draw stale plots that resizes or shows reveal."""
+    def __init__(self, parent, feature):
+        super().__init__(parent)
+        self.feature = feature
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Resize, QEvent.Show) and self.feature._stale_plots:
+            # Deferred so the plot widgets' geometry (and visibleRegion) is settled first
+            QTimer.singleShot(0, self.feature._redraw_stale_plots)
+        return False
+
+class _HistoryLoader(QObject):
+    """Runs TimeReportFeature._load_history off the GUI thread and hands the decoded arrays back by signal."""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(str)
+    done = pyqtSignal()
+
+    def __init__(self, feature, filename, start_time, end_time):
+        super().__init__()
+        self.feature = feature
+        self.filename = filename
+        self.start_time = start_time
+        self.end_time = end_time
+
+    def run(self):
+        try:
+            result = self.feature._load_history(self.filename, self.start_time, self.end_time, self.progress.emit)
+            self.finished.emit(result)
+        except Exception as e:
+            logging.error(f"Error loading data for {self.filename}: {str(e)}", exc_info=True)
+            self.error.emit(f"Error plotting data for {self.filename}: {str(e)}")
+        finally:
+            self.done.emit()
+
 class TimeReportFeature:
     def __init__(self, parent, db, project_name, channel=None, model_name=None, console=None, filename=None):
         self.parent = parent
@@ -168,8 +298,10 @@ class TimeReportFeature:
         self.widget = QWidget(self.parent)
         self.plot_widgets = []
         self.plots = [] # Stores the actual PlotDataItem objects
-        self.data = [] # List of np arrays for each channel's Y data
+        self.data = np.empty((0, 0), dtype=np.uint16) # (num_plots, N) raw ADC counts, one row per channel
+        self._row_scales = np.empty(0, dtype=np.float64) # counts-to-display factor per row of self.data
         self.channel_times = np.array([]) # Single np array for X time data (shared by all)
+        self._time_bounds = None # (first, last) of channel_times as floats, for mouse_moved
         self.vlines = []
         self.proxies = []
         self.trackers = []
@@ -188,8 +320,17 @@ class TimeReportFeature:
         self.end_time = None
         self.scaling_factor = 3.3 / 65535
         self.channel_properties = {}
+        self._channel_scales = np.empty(0, dtype=np.float64) # counts-to-unit factor per channel_names entry
+        self._channel_units = [] # display unit per channel_names entry
+        # Factor for main channels without properties (plain mil, unit gain), computed once
+        self._default_scale = self._counts_scale({"unit": "mil", "correctionValue": 1.0, "gain": 1.0, "sensitivity": 1.0})
+        self._loader = None # _HistoryLoader of the Fetch Data in flight, if any
+        self._load_thread = None
+        self._fetch_status_shown = False # status_label holds a "Fetching..."/progress text, not a result
+        self._closed = False # set by cleanup(); late queued loader results are ignored
+        self._stale_plots = set() # plots whose data changed while scrolled out of view
+        self._file_meta_cache = {} # filename -> boundary timestamps, see _file_meta
         self.channel_names = [] # Store channel names from DB
-        self.max_points_to_plot = 100000
         self.plot_colors = [
             '#0000FF', '#FF0000', '#00FF00', '#800080', '#FFA500', '#A52A2A',
             "#CF1E3B", '#0000FF', '#0000FF', '#0000FF', '#0000FF', '#FFD700',
@@ -250,6 +391,10 @@ class TimeReportFeature:
                             "sensitivity": sensitivity, # Keep original for reference if needed
                             "ConvertedSensitivity": converted_sensitivity
                         }
+                    # Calibration factors as one array in channel order, so decoding indexes instead of dict lookups
+                    self._channel_scales = np.array([self._counts_scale(self.channel_properties[name]) for name in self.channel_names],
+                                                    dtype=np.float64)
+                    self._channel_units = [self.channel_properties[name]["unit"] for name in self.channel_names]
                     break
             logging.debug(f"Loaded channel names: {self.channel_names}")
             logging.debug(f"Loaded channel properties: {self.channel_properties}")
@@ -258,6 +403,30 @@ class TimeReportFeature:
             if self.console:
                 self.console.append_to_console(f"Error loading channel properties: {str(e)}")
 
+    def _counts_scale(self, props):
+        """Single factor taking centered ADC counts to the channel's display unit.
+
+        Folds volts-per-count, correction * gain / sensitivity and the displacement unit
+        conversion (mil: /25.4, mm: /1000, um: 1) so calibration is one multiply per sample.
+        """
+        scale = self.scaling_factor * (props["correctionValue"] * props["gain"]) / max(props["sensitivity"], 1e-12)
+        if props.get("type", "Displacement") == "Displacement":
+            unit = (props.get("unit", "mil") or "mil").lower()
+            if unit == "mil":
+                scale /= 25.4
+            elif unit == "mm":
+                scale /= 1000.0
+        return scale
+
+    def _calibrate_counts(self, raw_counts, scale, out=None):
+        """(raw - 32768) * scale written into out (a new float32 array by default), without float64 temporaries."""
+        raw = np.asarray(raw_counts)
+        if out is None:
+            out = np.empty(raw.shape, dtype=np.float32)
+        np.multiply(raw, np.float32(scale), out=out, casting='unsafe')
+        out -= np.float32(32768.0 * scale)
+        return out
+
     def init_ui_deferred(self):
         self.setup_basic_ui()
         QTimer.singleShot(0, self.load_data_async)
@@ -356,6 +525,9 @@ class TimeReportFeature:
         file_layout.addWidget(file_label)
         file_layout.addWidget(self.file_combo)
         file_layout.addWidget(self.ok_button)
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #546e7a; font-size: 14px;")
+        file_layout.addWidget(self.status_label)
         file_layout.addStretch()
         controls_layout.addLayout(file_layout)
 
@@ -406,12 +578,18 @@ class TimeReportFeature:
         self.scroll_layout = QVBoxLayout(self.scroll_content)
         self.scroll_content.setStyleSheet("background-color: #ebeef2; border-radius: 5px; padding: 10px;")
         self.scroll_area.setWidget(self.scroll_content)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._redraw_stale_plots)
+        # Resizing/maximizing or showing the widget can reveal stale plots without any scrolling
+        self._viewport_watcher = _ViewportWatcher(self.scroll_area.viewport(), self)
+        self.scroll_area.viewport().installEventFilter(self._viewport_watcher)
         layout.addWidget(self.scroll_area, stretch=1)
 
         self.file_combo.setEnabled(False)
 
     def load_data_async(self):
         try:
+            # Fresh file list, fresh per-file metadata
+            self._file_meta_cache.clear()
             # Fetch filenames using the correct DB method
             self.filenames = self.db.get_distinct_filenames(self.project_name, self.model_name)
             self.file_combo.clear()
@@ -471,40 +649,60 @@ class TimeReportFeature:
         pass
 
     def update_time_from_slider(self):
+        # Slider values are already POSIX seconds; no QDateTime/datetime round-trip per tick
         left, right = self.time_slider.getValues()
         self.start_time = left
         self.end_time = right
         # Editors removed; nothing else to sync
 
+    def _file_meta(self, filename):
+        """Start/end of a file from its first and last message, fetched from the DB once per filename.
+
+        Returns None when the file has no messages (not cached, so a file that fills later is seen).
+        """
+        meta = self._file_meta_cache.get(filename)
+        if meta is not None:
+            return meta
+        messages = self.db.get_history_messages(self.project_name, self.model_name, filename=filename)
+        if not messages:
+            return None
+        # Earliest/latest message by creation time; no full sort needed for start/end
+        created_ts = _created_at_timestamps(messages)
+        first_idx = int(np.argmin(created_ts))
+        # Last of any equal maxima, as the old stable sort would have picked
+        last_idx = len(created_ts) - 1 - int(np.argmax(created_ts[::-1]))
+        last_message = messages[last_idx]
+        meta = {
+            "first_ts": float(created_ts[first_idx]),
+            "last_ts": float(created_ts[last_idx]),
+            # Duration comes from the *last* message's parameters
+            "sampling_size": last_message.get("samplingSize", 0),
+            "sampling_rate": last_message.get("samplingRate", 1),
+            # Only the two boundary messages need datetime objects (keeps their original tz)
+            "first_dt": datetime.fromisoformat(messages[first_idx]['createdAt'].replace('Z', '+00:00')),
+            "last_dt": datetime.fromisoformat(last_message['createdAt'].replace('Z', '+00:00')),
+        }
+        self._file_meta_cache[filename] = meta
+        return meta
+
     def update_time_labels(self, filename):
         try:
-            messages = self.db.get_history_messages(self.project_name, self.model_name, filename=filename)
-            if not messages:
+            meta = self._file_meta(filename)
+            if meta is None:
                 # No messages; reset time range on slider
                 self.time_slider.setRange(0, 1)
                 self.time_slider.setValues(0, 1)
                 return
 
-            # Sort messages by creation time to get accurate start/end
-            sorted_messages = sorted(messages, key=lambda x: datetime.fromisoformat(x['createdAt'].replace('Z', '+00:00')))
-            first_message = sorted_messages[0]
-            last_message = sorted_messages[-1]
-
-            first_created_at = datetime.fromisoformat(first_message['createdAt'].replace('Z', '+00:00'))
-            last_created_at = datetime.fromisoformat(last_message['createdAt'].replace('Z', '+00:00'))
-
             # Duration calculation based on the *last* message's parameters
-            sampling_size = last_message.get("samplingSize", 0)
-            sampling_rate = last_message.get("samplingRate", 1)
+            sampling_size = meta["sampling_size"]
+            sampling_rate = meta["sampling_rate"]
             if sampling_rate <= 0:
                  raise ValueError(f"Invalid sampling rate {sampling_rate} in message")
             duration = sampling_size / sampling_rate
 
-            file_start = first_created_at
-            file_end = last_created_at + timedelta(seconds=duration)
-
-            self.file_start_time = file_start.timestamp()
-            self.file_end_time = file_end.timestamp()
+            self.file_start_time = meta["first_ts"]
+            self.file_end_time = meta["last_ts"] + duration
             self.start_time = self.file_start_time
             self.end_time = self.file_end_time
             # Update slider range and values only; labels/edits removed
@@ -538,6 +736,12 @@ class TimeReportFeature:
                 plot_widget.addLegend()
                 axis = TimeAxisItem(orientation='bottom')
                 plot_widget.setAxisItems({'bottom': axis})
+                if ch > 0:
+                    # One shared time axis: pan/zoom on any plot moves all of them together
+                    plot_widget.setXLink(self.plot_widgets[0])
+                if ch < total_channels - 1:
+                    # Only the bottom plot labels its ticks; the others skip tickStrings entirely
+                    axis.setStyle(showValues=False)
 
                 # Determine channel name and y-label
                 if ch < len(self.channel_names):
@@ -549,7 +753,7 @@ class TimeReportFeature:
                 else:
                     channel_name = f"Channel {ch + 1}"
 
-                unit = self.channel_properties.get(channel_name, {}).get("unit", "mil")
+                unit = self._channel_units[ch] if ch < len(self._channel_units) else "mil"
                 y_label = f"Amplitude ({unit})" if ch < main_channels else "Value"
 
                 # Set Y range for tacho channels
@@ -558,10 +762,15 @@ class TimeReportFeature:
 
                 plot_widget.getAxis('left').setLabel(f"{channel_name} ({y_label})")
                 # Initial empty plot - store the PlotDataItem
-                plot_data_item = plot_widget.plot([], [], pen=mkPen(color=self.plot_colors[ch % len(self.plot_colors)], width=2), name=channel_name)
+                # Samples are calibrated ADC counts, always finite: let pyqtgraph skip its NaN/Inf scan
+                plot_data_item = plot_widget.plot([], [], pen=mkPen(color=self.plot_colors[ch % len(self.plot_colors)], width=2), name=channel_name,
+                                                  connect='all', skipFiniteCheck=True)
                 self.plot_widgets.append(plot_widget)
                 self.plots.append(plot_data_item) # Store the PlotDataItem, not the widget
                 self.scroll_layout.addWidget(plot_widget)
+                # Full-resolution series: pyqtgraph clips to the view and peak-downsamples at paint time
+                plot_data_item.setDownsampling(auto=True, method='peak')
+                plot_data_item.setClipToView(True)
 
                 vline = InfiniteLine(pos=0, angle=90, movable=False, pen=mkPen('k', width=1, style=Qt.DashLine))
                 vline.setVisible(False)
@@ -581,28 +790,61 @@ class TimeReportFeature:
             if self.console:
                 self.console.append_to_console(f"Error initializing plots: {str(e)}")
 
-    def downsample_array(self, data, factor):
-        if factor <= 1 or len(data) == 0:
-            return data
-        # Ensure data is a numpy array for efficient operations
-        data = np.asarray(data)
-        output_length = int(np.ceil(len(data) / factor))
-        # Reshape data to group elements for averaging
-        # Truncate data to make its length divisible by factor
-        truncated_len = (len(data) // factor) * factor
-        if truncated_len == 0:
-            # If not enough data, return the mean
-            return np.array([np.mean(data)]) if len(data) > 0 else np.array([])
-        truncated_data = data[:truncated_len]
-        reshaped_data = truncated_data.reshape(-1, factor)
-        downsampled = np.mean(reshaped_data, axis=1)
-
-        # If there were leftover elements, average them and append
-        if truncated_len < len(data):
-            leftover = data[truncated_len:]
-            downsampled = np.append(downsampled, np.mean(leftover))
-
-        return downsampled
+    def _plot_buckets(self, plot_widget=None):
+        """Trigger marker bucket count for plot_widget (or the widest plot): one bucket per horizontal pixel."""
+        widgets = [plot_widget] if plot_widget is not None else self.plot_widgets
+        px = max((pw.width() for pw in widgets), default=1200)
+        return max(MIN_PLOT_BUCKETS, px)
+
+    def _redraw_plot(self, ch):
+        """Draw plot ch from its full-resolution counts; pyqtgraph clips and downsamples them per view."""
+        if not (0 <= ch < len(self.plots)) or ch >= len(self.data) or len(self.channel_times) == 0:
+            return
+        # Off-screen plots are only marked; _redraw_stale_plots draws them once scrolled into view
+        if self.plot_widgets[ch].visibleRegion().isEmpty():
+            self._stale_plots.add(ch)
+            return
+        self._stale_plots.discard(ch)
+        n = min(len(self.channel_times), len(self.data[ch]))
+        x = self.channel_times[:n]
+        y = self.data[ch][:n]
+        # Clipping and peak downsampling happen inside pyqtgraph on every view change
+        self.plots[ch].setData(x, self._calibrate_counts(y, self._row_scales[ch]), skipFiniteCheck=True)
+
+    def _redraw_stale_plots(self, *args):
+        """Draw plots that were skipped while off-screen and are now (partly) in the scroll viewport."""
+        for ch in sorted(self._stale_plots):
+            if ch < len(self.plot_widgets) and not self.plot_widgets[ch].visibleRegion().isEmpty():
+                self._redraw_plot(ch)
+
+    def trigger_marker_indices(self, counts, scale, n_buckets):
+        """Index of the first high (>= 0.5 after calibration) sample in each bucket that has one.
+
+        The trigger is binary, so it is thresholded once in count space to one bit per sample and
+        packed 8 per byte; buckets are whole bytes, and "any high in bucket" is an OR over each
+        bucket's bytes. Only the (few) high buckets are searched for their first high sample.
+        """
+        counts = np.asarray(counts)
+        n = len(counts)
+        if n == 0 or scale <= 0:
+            return np.empty(0, dtype=np.int64)
+        threshold = 32768.0 + 0.5 / scale
+        if counts.dtype.kind == 'u':
+            # Integer counts: compare against the smallest count that clears the threshold, so
+            # the scan stays in the native 2-byte dtype instead of upcasting to float64
+            threshold = int(np.ceil(threshold))
+            if threshold > np.iinfo(counts.dtype).max:
+                return np.empty(0, dtype=np.int64)
+            threshold = counts.dtype.type(threshold)
+        high = counts >= threshold
+        # Bucket length rounded down to whole bytes of packed bits (at least one byte)
+        bucket_bytes = max(1, n // max(1, n_buckets) // 8)
+        packed = np.packbits(high)
+        any_high = np.bitwise_or.reduceat(packed, np.arange(0, len(packed), bucket_bytes)) != 0
+        bucket = 8 * bucket_bytes
+        starts = np.flatnonzero(any_high) * bucket
+        return np.fromiter((start + int(np.argmax(high[start:start + bucket])) for start in starts.tolist()),
+                           dtype=np.int64, count=len(starts))
 
     def plot_data(self):
         # Use the userData (actual filename) for plotting
@@ -613,40 +855,89 @@ class TimeReportFeature:
             if self.console:
                 self.console.append_to_console("No valid file selected to plot.")
             return
+        if self._load_thread is not None:
+            logging.debug("Time Report load already in progress; ignoring Fetch Data")
+            return
 
-        progress = QProgressDialog("Loading and plotting data...", "Cancel", 0, 100, self.widget)
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
+        # Fetch and decode on a worker thread; the GUI only does the pyqtgraph updates in _on_data_ready
+        self.ok_button.setEnabled(False)
+        self.status_label.setText("Fetching data from database...")
+        self._fetch_status_shown = True
+        self._loader = _HistoryLoader(self, filename, self.start_time, self.end_time)
+        self._load_thread = QThread()
+        self._loader.moveToThread(self._load_thread)
+        self._load_thread.started.connect(self._loader.run)
+        self._loader.progress.connect(self.status_label.setText)
+        self._loader.finished.connect(self._on_data_ready)
+        self._loader.error.connect(self._on_load_error)
+        self._loader.done.connect(self._load_thread.quit)
+        self._load_thread.finished.connect(self._loader.deleteLater)
+        self._load_thread.finished.connect(self._load_thread.deleteLater)
+        self._load_thread.finished.connect(self._on_load_thread_finished)
+        self._load_thread.start()
+
+    def _on_load_thread_finished(self):
+        self._loader = None
+        self._load_thread = None
+        # Only clear the in-progress text; keep the result/error status set by the slots
+        if self._fetch_status_shown and not self._closed:
+            self.status_label.setText("")
+        self._fetch_status_shown = False
+
+    def _set_result_status(self, text):
+        self._fetch_status_shown = False
+        self.status_label.setText(text)
+        self.ok_button.setEnabled(bool(self.selected_filename))
+
+    def _load_history(self, filename, start_time, end_time, progress):
+        """Fetch, validate, decode and calibrate one file's messages; runs on the loader thread, touches no widgets."""
+        # --- 1. Fetch Data ---
+        progress("Fetching data from database...")
+        messages = self.db.get_history_messages(self.project_name, self.model_name, filename=filename)
+        if not messages:
+            raise ValueError(f"No data found for filename {filename}")
+
+        # --- 2. Sort and Filter Messages ---
+        progress("Sorting messages...")
         try:
-            # --- 1. Fetch Data ---
-            progress.setLabelText("Fetching data from database...")
-            progress.setValue(10)
-            messages = self.db.get_history_messages(self.project_name, self.model_name, filename=filename)
-            if not messages:
-                raise ValueError(f"No data found for filename {filename}")
-
-            # --- 2. Sort and Filter Messages ---
-            progress.setLabelText("Sorting messages...")
-            progress.setValue(15)
+            # Parse all timestamps once, then order with NumPy's stable sort on float64 keys
+            created_ts = _created_at_timestamps(messages)
+            # The DB normally returns messages in creation order: one O(N) check skips the sort then
+            if np.all(created_ts[1:] >= created_ts[:-1]):
+                order = None
+                sorted_ts = created_ts
+            else:
+                order = np.argsort(created_ts, kind='stable')
+                sorted_ts = created_ts[order]
+            # Sorted keys make the selected time range two binary searches (matching C#: start <= t <= end)
+            # Scalar lookups: bisect over a memoryview returns ints directly, no NumPy dispatch or int() casts
+            lo = bisect.bisect_left(memoryview(sorted_ts), start_time) if start_time is not None else 0
+            hi = bisect.bisect_right(memoryview(sorted_ts), end_time) if end_time is not None else len(sorted_ts)
+            if order is None:
+                sorted_messages = messages[lo:hi]
+            else:
+                sorted_messages = [messages[i] for i in order[lo:hi].tolist()]
+            # Already-parsed POSIX seconds of those messages, in the same order
+            sorted_message_ts = sorted_ts[lo:hi].tolist()
+        except (ValueError, KeyError) as sort_error:
+            logging.error(f"Error sorting messages by 'createdAt': {sort_error}")
+            raise ValueError(f"Could not sort messages by timestamp: {sort_error}")
+
+        progress("Validating messages in the selected time range...")
+        # Only messages inside [start_time, end_time] are left to validate
+        filtered_messages = []
+        for msg, msg_created_at_ts in zip(sorted_messages, sorted_message_ts):
             try:
-                sorted_messages = sorted(messages, key=lambda x: datetime.fromisoformat(x['createdAt'].replace('Z', '+00:00')))
-            except (ValueError, KeyError) as sort_error:
-                logging.error(f"Error sorting messages by 'createdAt': {sort_error}")
-                raise ValueError(f"Could not sort messages by timestamp: {sort_error}")
-
-            progress.setLabelText("Filtering messages by time range and validating data...")
-            progress.setValue(20)
-            # Filter messages where created_at >= start_time and created_at <= end_time (matching C#)
-            filtered_messages = []
-            for msg in sorted_messages:
-                try:
-                    msg_created_at_dt = datetime.fromisoformat(msg['createdAt'].replace('Z', '+00:00'))
-                    msg_created_at_ts = msg_created_at_dt.timestamp()
-                    # --- CRITICAL: Strict Validation of samplingSize and samplingRate ---
-                    sampling_size_raw = msg.get("samplingSize")
-                    sampling_rate_raw = msg.get("samplingRate")
-                    message_data_raw = msg.get("message")
-
+                # --- CRITICAL: Strict Validation of samplingSize and samplingRate ---
+                sampling_size_raw = msg.get("samplingSize")
+                sampling_rate_raw = msg.get("samplingRate")
+                message_data_raw = msg.get("message")
+
+                # Happy path first: present, exactly typed, positive fields (nearly every message) need
+                # none of the coercion and diagnostics below
+                if not (type(sampling_size_raw) is int and sampling_size_raw > 0
+                        and type(sampling_rate_raw) in _NUM_TYPE_SET and sampling_rate_raw > 0
+                        and type(message_data_raw) in _SEQ_TYPE_SET):
                     # Check 1: Is the field present and not None?
                     if sampling_size_raw is None:
                         logging.warning(f"Skipping message (FrameIndex: {msg.get('frameIndex', 'N/A')}): 'samplingSize' field is missing or None.")
@@ -656,7 +947,7 @@ class TimeReportFeature:
                         continue
 
                     # Check 2: Is it the correct type?
-                    if not isinstance(sampling_size_raw, int):
+                    if type(sampling_size_raw) is not int and not isinstance(sampling_size_raw, int):
                          # Handle potential string representations of integers from DB
                          if isinstance(sampling_size_raw, str) and sampling_size_raw.isdigit():
                              try:
@@ -668,7 +959,7 @@ class TimeReportFeature:
                              logging.warning(f"Skipping message (FrameIndex: {msg.get('frameIndex', 'N/A')}): 'samplingSize' is not an integer ({type(sampling_size_raw)}: {sampling_size_raw})")
                              continue
 
-                    if not isinstance(sampling_rate_raw, (int, float)):
+                    if type(sampling_rate_raw) not in _NUM_TYPE_SET and not isinstance(sampling_rate_raw, _NUM_TYPES):
                          # Handle potential string representations
                          if isinstance(sampling_rate_raw, str):
                              try:
@@ -676,7 +967,7 @@ class TimeReportFeature:
                                  logging.info(f"Converted string 'samplingRate' to float: {sampling_rate_raw}")
                              except ValueError:
                                  pass # Conversion failed, will be caught below
-                         if not isinstance(sampling_rate_raw, (int, float)):
+                         if not isinstance(sampling_rate_raw, _NUM_TYPES):
                              logging.warning(f"Skipping message (FrameIndex: {msg.get('frameIndex', 'N/A')}): 'samplingRate' is not a number ({type(sampling_rate_raw)}: {sampling_rate_raw})")
                              continue
 
@@ -689,318 +980,269 @@ class TimeReportFeature:
                         continue
 
                     # Check 4: Is message data present?
-                    if message_data_raw is None or not isinstance(message_data_raw, (list, np.ndarray)):
+                    if message_data_raw is None or (type(message_data_raw) not in _SEQ_TYPE_SET
+                                                    and not isinstance(message_data_raw, _SEQ_TYPES)):
                          logging.warning(f"Skipping message (FrameIndex: {msg.get('frameIndex', 'N/A')}): Invalid or missing 'message' data")
                          continue
 
-                    # Check 5: Does created_at fall within the selected time range? (matching C#)
-                    if msg_created_at_ts >= self.start_time and msg_created_at_ts <= self.end_time:
-                        # --- If ALL checks pass, add to filtered list ---
-                        # Store the validated values to avoid .get() later
-                        msg['_validated_samplingSize'] = sampling_size_raw
-                        msg['_validated_samplingRate'] = sampling_rate_raw
-                        filtered_messages.append(msg)
-                    # --- END CRITICAL VALIDATION ---
-                except (ValueError, TypeError, KeyError) as e:
-                    logging.warning(f"Skipping message due to error parsing fields: {e}")
-                    continue
-
-            if not filtered_messages:
-                error_msg = (f"No valid data messages found within the selected time range for filename {filename}. "
-                             f"Check database for correct 'samplingSize' (must be positive int), "
-                             f"'samplingRate' (must be positive number), and 'message' fields.")
-                raise ValueError(error_msg)
-
-            # --- 3. Get Structure from First VALID Filtered Message ---
-            # CRITICAL: Set sample_rate and samples_per_channel HERE from the first valid message
-            # BEFORE using them in any calculations.
-            progress.setLabelText("Getting data structure from first valid message...")
-            progress.setValue(25)
-            
-            # --- CRITICAL FIX: Validate and assign from first message ---
-            first_valid_msg = filtered_messages[0] # Use the first *filtered* message
-            main_channels = first_valid_msg.get("numberOfChannels", 0)
-            # Note: DB field name discrepancy with C# (tachoChannelCount vs tacoChannelCount)
-            tacho_channels = first_valid_msg.get("tachoChannelCount", 0) or first_valid_msg.get("tacoChannelCount", 0)
-            
-            # --- CRITICAL: Use the validated values stored during filtering ---
-            # This ensures we are using the confirmed good values.
-            validated_samples_per_channel = first_valid_msg.get('_validated_samplingSize')
-            validated_sample_rate = first_valid_msg.get('_validated_samplingRate')
-            # --- END CRITICAL ASSIGNMENT ---
-
-            # --- ULTIMATE SANITY CHECK ---
-            # This is the final, paranoid check before the calculation.
-            if validated_samples_per_channel is None or not isinstance(validated_samples_per_channel, int) or validated_samples_per_channel <= 0:
-                 raise ValueError(f"FATAL: First valid message's validated 'samplingSize' is invalid: {validated_samples_per_channel} (Type: {type(validated_samples_per_channel)})")
-            if validated_sample_rate is None or not isinstance(validated_sample_rate, (int, float)) or validated_sample_rate <= 0:
-                 raise ValueError(f"FATAL: First valid message's validated 'samplingRate' is invalid: {validated_sample_rate} (Type: {type(validated_sample_rate)})")
-            # --- END ULTIMATE SANITY CHECK ---
-
-            # Now it's safe to assign to instance variables
-            self.samples_per_channel = validated_samples_per_channel
-            self.sample_rate = validated_sample_rate
-
-            total_channels = main_channels + tacho_channels
-            # --- FIXED LINE: Now guaranteed safe by the checks above ---
-            expected_length_per_msg = self.samples_per_channel * total_channels # <-- Should not fail now
-            # --- END FIXED LINE ---
-            
-            logging.debug(f"First valid message structure: main_channels={main_channels}, tacho_channels={tacho_channels}, "
-                          f"samples_per_channel={self.samples_per_channel}, sample_rate={self.sample_rate}, "
-                          f"total_channels={total_channels}, expected_length_per_msg={expected_length_per_msg}")
-
-            # --- 4. Initialize Plots ---
-            progress.setLabelText("Initializing plots...")
-            progress.setValue(30)
-            self.init_plots(main_channels, tacho_channels)
-
-            # --- 5. Process Data ---
-            progress.setLabelText("Processing data...")
-            progress.setValue(40)
-
-            # Pre-allocate lists for channel data
-            channel_data_buffers = [[] for _ in range(total_channels)]
-            time_buffer = []
-
-            # Iterate through filtered messages and process data
-            num_msgs = len(filtered_messages)
-            for i, msg in enumerate(filtered_messages):
-                if progress.wasCanceled():
-                    break
-                # Update progress from 40% to 80%
-                progress.setValue(40 + int(35 * i / max(num_msgs, 1)))
-                QApplication.processEvents()
-
-                # --- CRITICAL: Validate message data AGAIN using validated values ---
-                # Use the validated values stored in the message dict
-                validated_samples_per_channel_msg = msg.get('_validated_samplingSize')
-                validated_sample_rate_msg = msg.get('_validated_samplingRate')
-
-                # Re-check message length based on the confirmed structure
-                # Use the validated values from THIS specific message
-                expected_len_for_this_msg = validated_samples_per_channel_msg * total_channels
-                flattened_data = msg.get("message", [])
-                if not isinstance(flattened_data, (list, np.ndarray)) or len(flattened_data) != expected_len_for_this_msg:
-                    logging.warning(f"Skipping message {msg.get('frameIndex')} during processing due to data length mismatch. "
-                                    f"Expected (validated) {expected_len_for_this_msg}, got {len(flattened_data)}")
-                    continue # Skip this message, continue with others
-
-                msg_created_at_dt = datetime.fromisoformat(msg['createdAt'].replace('Z', '+00:00'))
-                msg_created_at_ts = msg_created_at_dt.timestamp()
+                # --- If ALL checks pass, add to filtered list ---
+                # (the time range was already applied when slicing the sorted messages)
+                # Store the validated values to avoid .get() later
+                msg['_validated_samplingSize'] = sampling_size_raw
+                msg['_validated_samplingRate'] = sampling_rate_raw
+                msg['_ts'] = msg_created_at_ts # from the batch parse above; reused for the time axis
+                filtered_messages.append(msg)
                 # --- END CRITICAL VALIDATION ---
-
-                # --- Unflatten and Process ---
-                # Contiguous blocks per channel (matches Time View)
-                for ch in range(total_channels):
-                    ch_start = ch * validated_samples_per_channel_msg
-                    ch_end = ch_start + validated_samples_per_channel_msg
-                    ch_data = flattened_data[ch_start:ch_end]
-                    channel_data_buffers[ch].extend(ch_data)
-
-                # Build per-sample timestamps for this message
-                base_time = msg_created_at_dt
-                time_step_msg = 1.0 / float(validated_sample_rate_msg)
-                time_buffer.extend([base_time.timestamp() + i * time_step_msg for i in range(validated_samples_per_channel_msg)])
-
-            # --- 6. Combine Data and Generate Time Axis (chronological) ---
-            progress.setLabelText("Combining data and generating time axis...")
-            progress.setValue(80)
-            if not filtered_messages:
-                 raise ValueError("No valid data found in selected messages after processing")
-
-            # Concatenate all data
-            combined_data = [np.array(buf) for buf in channel_data_buffers]
-
-            # Build time axis from concatenated per-message timestamps
-            combined_times = np.array(time_buffer, dtype=np.float64)
-
-            # Calculate total samples
-            total_samples = len(combined_times)
-            if total_samples == 0:
-                 raise ValueError("No data points found after concatenation")
-
-            # No need for further filtering since we use linear time and full data from selected messages
-
-            # --- 7. Calibration and Downsampling ---
-            progress.setLabelText("Applying calibration and downsampling...")
-            progress.setValue(90)
-
-            processed_data = []
-            total_points = total_samples
-            needs_downsampling = total_points > self.max_points_to_plot
-            downsample_factor = int(np.ceil(total_points / self.max_points_to_plot)) if needs_downsampling else 1
-
-            if needs_downsampling:
-                logging.debug(f"Downsampling data by factor of {downsample_factor} (from {total_points} to ~{total_points // downsample_factor} points)")
-
-            # Calibrate Main Channels to mirror Time View (unit-aware)
-            for ch in range(main_channels):
-                raw_counts = combined_data[ch]
-                # Convert ADC counts to volts (centered around 0V)
-                volts = (np.asarray(raw_counts, dtype=np.float64) - 32768.0) * self.scaling_factor
-
-                channel_name = self.channel_names[ch] if ch < len(self.channel_names) else f"Channel {ch + 1}"
-                props = self.channel_properties.get(channel_name, {
-                    "unit": "mil", "correctionValue": 1.0, "gain": 1.0, "sensitivity": 1.0
-                })
-
-                try:
-                    base_value = volts * (props["correctionValue"] * props["gain"]) / max(props["sensitivity"], 1e-12)
-                except (ZeroDivisionError, TypeError) as cal_error:
-                    logging.error(f"Calibration error for channel {channel_name}: {cal_error}. Using volts.")
-                    base_value = volts
-                unit = (props.get("unit", "mil") or "mil").lower()
-                if props.get("type", "Displacement") == "Displacement":
-                    if unit == "mil":
-                        calibrated_data = base_value / 25.4
-                    elif unit == "um":
-                        calibrated_data = base_value
-                    elif unit == "mm":
-                        calibrated_data = base_value / 1000.0
-                    else:
-                        calibrated_data = base_value
-                else:
-                    calibrated_data = base_value
-
-                if needs_downsampling and len(calibrated_data) > 0:
-                    calibrated_data = self.downsample_array(calibrated_data, downsample_factor)
-                processed_data.append(calibrated_data)
-
-            # Handle Tacho Channels to mirror Time View scaling
-            for tch_idx, ch in enumerate(range(main_channels, total_channels)):
-                raw_counts = combined_data[ch]
-                volts = (np.asarray(raw_counts, dtype=np.float64) - 32768.0) * self.scaling_factor
-                processed_tacho_data = (volts / 100.0) if tch_idx == 0 else volts
-
-                if needs_downsampling and len(processed_tacho_data) > 0:
-                    processed_tacho_data = self.downsample_array(processed_tacho_data, downsample_factor)
-                processed_data.append(processed_tacho_data)
-
-            # Downsample times if needed
-            if needs_downsampling and len(combined_times) > 0:
-                combined_times = self.downsample_array(combined_times, downsample_factor)
-
-            # --- 8. Plotting ---
-            progress.setLabelText("Updating plots...")
-            progress.setValue(95)
+            except (ValueError, TypeError, KeyError) as e:
+                logging.warning(f"Skipping message due to error parsing fields: {e}")
+                continue
+
+        if not filtered_messages:
+            error_msg = (f"No valid data messages found within the selected time range for filename {filename}. "
+                         f"Check database for correct 'samplingSize' (must be positive int), "
+                         f"'samplingRate' (must be positive number), and 'message' fields.")
+            raise ValueError(error_msg)
+
+        # --- 3. Get Structure from First VALID Filtered Message ---
+        # CRITICAL: Set sample_rate and samples_per_channel HERE from the first valid message
+        # BEFORE using them in any calculations.
+        progress("Getting data structure from first valid message...")
+        
+        # --- CRITICAL FIX: Validate and assign from first message ---
+        first_valid_msg = filtered_messages[0] # Use the first *filtered* message
+        main_channels = first_valid_msg.get("numberOfChannels", 0)
+        # Note: DB field name discrepancy with C# (tachoChannelCount vs tacoChannelCount)
+        tacho_channels = first_valid_msg.get("tachoChannelCount", 0) or first_valid_msg.get("tacoChannelCount", 0)
+        
+        # --- CRITICAL: Use the validated values stored during filtering ---
+        # This ensures we are using the confirmed good values.
+        validated_samples_per_channel = first_valid_msg.get('_validated_samplingSize')
+        validated_sample_rate = first_valid_msg.get('_validated_samplingRate')
+        # --- END CRITICAL ASSIGNMENT ---
+
+        # --- ULTIMATE SANITY CHECK ---
+        # This is the final, paranoid check before the calculation.
+        if validated_samples_per_channel is None or not isinstance(validated_samples_per_channel, int) or validated_samples_per_channel <= 0:
+             raise ValueError(f"FATAL: First valid message's validated 'samplingSize' is invalid: {validated_samples_per_channel} (Type: {type(validated_samples_per_channel)})")
+        if validated_sample_rate is None or not isinstance(validated_sample_rate, (int, float)) or validated_sample_rate <= 0:
+             raise ValueError(f"FATAL: First valid message's validated 'samplingRate' is invalid: {validated_sample_rate} (Type: {type(validated_sample_rate)})")
+        # --- END ULTIMATE SANITY CHECK ---
+
+        # Now it's safe to use them; the GUI thread stores them in _on_data_ready
+        samples_per_channel = validated_samples_per_channel
+        sample_rate = validated_sample_rate
+
+        total_channels = main_channels + tacho_channels
+        # --- FIXED LINE: Now guaranteed safe by the checks above ---
+        expected_length_per_msg = samples_per_channel * total_channels # <-- Should not fail now
+        # --- END FIXED LINE ---
+        
+        logging.debug(f"First valid message structure: main_channels={main_channels}, tacho_channels={tacho_channels}, "
+                      f"samples_per_channel={samples_per_channel}, sample_rate={sample_rate}, "
+                      f"total_channels={total_channels}, expected_length_per_msg={expected_length_per_msg}")
+
+        # --- 5. Process Data ---
+        progress("Processing data...")
+
+        # Keep only messages whose payload matches the confirmed structure, so the output size is known
+        usable_messages = []
+        for msg in filtered_messages:
+            # --- CRITICAL: Validate message data AGAIN using validated values ---
+            # Use the validated values stored in the message dict
+            validated_samples_per_channel_msg = msg['_validated_samplingSize']
+
+            # Re-check message length based on the confirmed structure
+            # Use the validated values from THIS specific message
+            expected_len_for_this_msg = validated_samples_per_channel_msg * total_channels
+            # Type already validated during filtering; only the length depends on the confirmed structure
+            flattened_data = msg["message"]
+            if len(flattened_data) != expected_len_for_this_msg:
+                logging.warning(f"Skipping message {msg.get('frameIndex')} during processing due to data length mismatch. "
+                                f"Expected (validated) {expected_len_for_this_msg}, got {len(flattened_data)}")
+                continue # Skip this message, continue with others
+            usable_messages.append(msg)
+            # --- END CRITICAL VALIDATION ---
+
+        # Calculate total samples
+        total_samples = sum(msg['_validated_samplingSize'] for msg in usable_messages)
+        if total_samples == 0:
+             raise ValueError("No data points found after concatenation")
+
+        # All channels share the time axis, so counts live in one C-ordered (channels, N) block.
+        # ADC counts fit 16 bits (a quarter of float64); the block is widened to float32 counts once
+        # if a message carries anything else
+        raw_counts = np.empty((total_channels, total_samples), dtype=np.uint16)
+        combined_times = np.empty(total_samples, dtype=np.float64)
+        num_msgs = len(usable_messages)
+        same_size = all(msg['_validated_samplingSize'] == samples_per_channel for msg in usable_messages)
+
+        if same_size:
+            # --- Unflatten and Process ---
+            # Every message has the same shape (the normal case): convert all payloads in one call and
+            # move the (messages, channels, samples) stack into (channels, messages, samples) order,
+            # which is the (channels, N) block viewed per message. No per-message Python work
+            stacked = np.asarray([msg["message"] for msg in usable_messages]).reshape(num_msgs, total_channels, samples_per_channel)
+            fits = np.ones(total_channels, dtype=bool)
+            if _pack_counts is not None and np.issubdtype(stacked.dtype, np.integer):
+                # Native single pass: check, transpose and narrow together
+                _pack_counts(stacked, raw_counts, fits)
+            else:
+                fits[:] = _fits_uint16(stacked)
+                if fits.all():
+                    raw_counts.reshape(total_channels, num_msgs, samples_per_channel)[...] = stacked.transpose(1, 0, 2)
+            if not fits.all():
+                raw_counts = np.ascontiguousarray(stacked.transpose(1, 0, 2), dtype=np.float32).reshape(total_channels, total_samples)
+        else:
+            # Iterate through usable messages and process data
+            offset = 0
+            for msg in usable_messages:
+                n = msg['_validated_samplingSize']
+                # Contiguous blocks per channel (matches Time View): one reshape gives every channel's row
+                block = np.asarray(msg["message"]).reshape(total_channels, n)
+                if raw_counts.dtype == np.uint16 and not _fits_uint16(block):
+                    raw_counts = raw_counts.astype(np.float32)
+                raw_counts[:, offset:offset + n] = block
+                offset += n
+
+        # Build per-sample timestamps: message start + sample offset. With one size and rate for all
+        # messages (the normal case) that is a single broadcast add into the (messages, samples) view
+        starts = np.fromiter((msg['_ts'] for msg in usable_messages), dtype=np.float64, count=num_msgs)
+        if same_size and all(msg['_validated_samplingRate'] == sample_rate for msg in usable_messages):
+            sample_offsets = np.arange(samples_per_channel, dtype=np.float64) / float(sample_rate)
+            np.add(starts[:, None], sample_offsets, out=combined_times.reshape(num_msgs, samples_per_channel))
+        else:
+            offset = 0
+            for msg, start in zip(usable_messages, starts.tolist()):
+                n = msg['_validated_samplingSize']
+                combined_times[offset:offset + n] = start + np.arange(n) / float(msg['_validated_samplingRate'])
+                offset += n
+
+        # --- 7. Calibration ---
+        progress("Applying calibration...")
+
+        # One factor per row: main channels mirror Time View (unit-aware), channels without
+        # properties get the plain mil default, tacho rows are volts (frequency channel arrives x100)
+        scales = np.full(total_channels, self.scaling_factor, dtype=np.float64)
+        scales[:main_channels] = self._default_scale
+        known = min(main_channels, len(self._channel_scales))
+        scales[:known] = self._channel_scales[:known]
+        if tacho_channels > 0:
+            scales[main_channels] = self.scaling_factor / 100.0
+        # Applied per drawn plot (_calibrate_counts), never to the whole block
+
+        return {
+            "filename": filename,
+            "main_channels": main_channels,
+            "tacho_channels": tacho_channels,
+            "samples_per_channel": samples_per_channel,
+            "sample_rate": sample_rate,
+            "counts": raw_counts,
+            "scales": scales,
+            "times": combined_times,
+        }
+
+    def _on_data_ready(self, result):
+        if self._closed:
+            return
+        filename = result["filename"]
+        try:
+            self.samples_per_channel = result["samples_per_channel"]
+            self.sample_rate = result["sample_rate"]
+            self.init_plots(result["main_channels"], result["tacho_channels"])
+            combined_times = result["times"]
+            # Trigger markers follow the plot width, now that the plots exist: one bucket per pixel
+            n_buckets = self._plot_buckets()
 
             # --- CRITICAL FIX: Ensure data and times are NumPy arrays ---
-            # Assign processed data and times
-            self.data = [np.asarray(d, dtype=np.float64) for d in processed_data] # Ensure float64
+            # Keep raw counts and times at full resolution; plots get calibrated float32 as they are drawn
+            self.data = result["counts"]
+            self._row_scales = result["scales"]
             self.channel_times = np.asarray(combined_times, dtype=np.float64) # Ensure float64
+            self._time_bounds = (float(self.channel_times[0]), float(self.channel_times[-1])) if len(self.channel_times) else None
 
             # --- CRITICAL FIX: Check for matching lengths before plotting ---
             if len(self.channel_times) == 0:
                  raise ValueError("No valid time data to plot after filtering/downsampling.")
 
-            # Plot each channel
+            # Plot each channel as it scrolls into view
             for ch in range(self.num_plots):
                 # Check if we have data for this channel and times
                 if ch < len(self.data) and len(self.data[ch]) > 0 and len(self.channel_times) > 0:
                     # --- CRITICAL CHECK: Lengths must match ---
                     if len(self.data[ch]) != len(self.channel_times):
                         logging.error(f"Data length mismatch for plot {ch}: data={len(self.data[ch])}, times={len(self.channel_times)}")
-                        # Optionally, truncate/pad or skip
-                        min_len = min(len(self.data[ch]), len(self.channel_times))
-                        plot_y_data = self.data[ch][:min_len]
-                        plot_x_times = self.channel_times[:min_len]
-                        logging.warning(f"Truncated data for plot {ch} to length {min_len} to match.")
-                    else:
-                        plot_y_data = self.data[ch]
-                        plot_x_times = self.channel_times
-
-                    # Determine channel name for legend
-                    if ch < len(self.channel_names):
-                        channel_name = self.channel_names[ch]
-                    elif ch == len(self.channel_names):
-                        channel_name = "Frequency"
-                    elif ch == len(self.channel_names) + 1:
-                        channel_name = "Trigger"
-                    else:
-                        channel_name = f"Channel {ch + 1}"
-
-                    # --- CRITICAL FIX: Use the correct PlotDataItem (self.plots[ch]) ---
-                    # And ensure data is NumPy array of correct type
-                    pen = mkPen(color=self.plot_colors[ch % len(self.plot_colors)], width=2)
-                    
-                    # --- Ensure data is float64 for pyqtgraph ---
-                    plot_x_times_f64 = np.asarray(plot_x_times, dtype=np.float64)
-                    plot_y_data_f64 = np.asarray(plot_y_data, dtype=np.float64)
-                    
-                    # --- Use setData for efficient update ---
-                    self.plots[ch].setData(plot_x_times_f64, plot_y_data_f64, pen=pen, name=channel_name)
-                    
+                        logging.warning(f"Plot {ch} will be truncated to length {min(len(self.data[ch]), len(self.channel_times))} to match.")
+                    # The plots are not laid out yet; _redraw_plot draws each one once it is on screen
+                    self._stale_plots.add(ch)
                     # --- Update the plot widget's axes and ranges ---
                     plot_widget = self.plot_widgets[ch]
                     # Set X range to selected time window
                     plot_widget.setXRange(self.start_time, self.end_time, padding=0.02)
                     # Enable auto-range for Y to fit the data
                     plot_widget.enableAutoRange(axis='y')
-                    logging.debug(f"Plotted channel {ch} ({channel_name}): {len(plot_y_data_f64)} points")
                 else:
                     logging.warning(f"Skipping plot {ch}: data length={len(self.data[ch]) if ch < len(self.data) else 'N/A'}, times length={len(self.channel_times)}")
                     # Clear the plot if no data
                     if ch < len(self.plots):
                          self.plots[ch].setData([], []) # Clear plot data
 
-
             # --- 9. Trigger Lines (Optional) ---
             # Add vertical lines on Trigger plot where Trigger == 1
             # Find the Trigger plot index (should be the last one if tacho_channels >= 2)
             if self.tacho_channels_count >= 2 and self.num_plots > 1:
                  trigger_plot_idx = self.num_plots - 1 # Assuming last plot is Trigger
                  # Ensure we have data for the trigger plot
-                 if trigger_plot_idx < len(self.data) and len(self.data[trigger_plot_idx]) > 0 and len(self.channel_times) > 0:
-                     trigger_data = self.data[trigger_plot_idx]
-                     trigger_times = self.channel_times
-                     # Check lengths again for trigger data
-                     if len(trigger_data) == len(trigger_times):
-                         # Clear previous trigger lines
-                         for line in self.trigger_lines:
-                             if line.scene() is not None:
-                                 line.scene().removeItem(line)
-                         self.trigger_lines = []
-
-                         # Find indices where trigger is high (assuming 1 or > 0.5 for robustness)
-                         # Use numpy for efficient finding
-                         trigger_indices = np.where(trigger_data >= 0.5)[0]
-                         logging.debug(f"Found {len(trigger_indices)} trigger events.")
-                         for idx in trigger_indices:
-                             if idx < len(trigger_times):
-                                 line = InfiniteLine(
-                                     pos=trigger_times[idx],
-                                     angle=90,
-                                     movable=False,
-                                     pen=mkPen('k', width=1, style=Qt.SolidLine) # Solid line for triggers
-                                 )
-                                 self.plot_widgets[trigger_plot_idx].addItem(line)
-                                 self.trigger_lines.append(line) # Keep reference
-                     else:
-                         logging.error(f"Trigger data length mismatch: data={len(trigger_data)}, times={len(trigger_times)}")
-
-
-            progress.setValue(100)
-            progress.close()
+                 if trigger_plot_idx in self._stale_plots:
+                     n = min(len(self.data[trigger_plot_idx]), len(self.channel_times))
+                     # Clear previous trigger lines
+                     for line in self.trigger_lines:
+                         if line.scene() is not None:
+                             line.scene().removeItem(line)
+                     self.trigger_lines = []
+
+                     # At most one line per pixel bucket: the first high sample of each bucket with any
+                     trigger_indices = self.trigger_marker_indices(self.data[trigger_plot_idx][:n],
+                                                                   self._row_scales[trigger_plot_idx], n_buckets)
+                     trigger_times = self.channel_times[trigger_indices]
+                     logging.debug(f"Found {len(trigger_indices)} trigger events.")
+                     if len(trigger_times):
+                         # All markers as one item of disconnected vertical segments (one scene item, one
+                         # paint) spanning the tacho plot band; kept out of the Y auto-range
+                         xs = np.repeat(trigger_times, 2)
+                         ys = np.tile(np.array([-0.5, 1.5]), len(trigger_times))
+                         line = pg.PlotDataItem(xs, ys, connect='pairs', skipFiniteCheck=True,
+                                                pen=mkPen('k', width=1, style=Qt.SolidLine)) # Solid line for triggers
+                         self.plot_widgets[trigger_plot_idx].addItem(line, ignoreBounds=True)
+                         self.trigger_lines.append(line) # Keep reference
+
+            # Draw whatever is on screen once the new plots have been laid out
+            QTimer.singleShot(0, self._redraw_stale_plots)
+
             success_msg = f"Time Report ({self.model_name}): Successfully plotted {self.num_plots} plots for {filename}"
             logging.info(success_msg)
+            self._set_result_status(f"Plotted {self.num_plots} plots for {filename}")
             if self.console:
                 self.console.append_to_console(success_msg)
 
         except Exception as e:
             logging.error(f"Error plotting data for {filename}: {str(e)}", exc_info=True) # Log full traceback
-            self.clear_plots()
-            progress.setValue(100)
-            progress.close()
-            error_msg = f"Error plotting data for {filename}: {str(e)}"
-            QMessageBox.critical(self.widget, "Plot Error", error_msg)
-            if self.console:
-                self.console.append_to_console(error_msg)
+            self._on_load_error(f"Error plotting data for {filename}: {str(e)}")
+
+    def _on_load_error(self, error_msg):
+        if self._closed:
+            return
+        self._set_result_status("Fetch failed")
+        self.clear_plots()
+        QMessageBox.critical(self.widget, "Plot Error", error_msg)
+        if self.console:
+            self.console.append_to_console(error_msg)
 
     def clear_plots(self):
         # Clear data lists/arrays
-        self.data = []
+        self.data = np.empty((0, 0), dtype=np.uint16)
+        self._row_scales = np.empty(0, dtype=np.float64)
         self.channel_times = np.array([])
+        self._time_bounds = None
         # Clear trigger lines and remove them from the scene
         for line in self.trigger_lines:
              if line.scene() is not None:
@@ -1025,6 +1267,7 @@ class TimeReportFeature:
         self.vlines = []
         self.proxies = []
         self.trackers = []
+        self._stale_plots = set()
         self.num_plots = 0
         self.num_channels = 0
         self.tacho_channels_count = 0
@@ -1036,20 +1279,13 @@ class TimeReportFeature:
     def get_file_times(self, filename):
         """Return (start_datetime, end_datetime) for a file by inspecting messages."""
         try:
-            messages = self.db.get_history_messages(self.project_name, self.model_name, filename=filename)
-            if not messages:
+            meta = self._file_meta(filename)
+            if meta is None:
                 return None, None
-            sorted_messages = sorted(messages, key=lambda x: datetime.fromisoformat(x['createdAt'].replace('Z', '+00:00')))
-            first_message = sorted_messages[0]
-            last_message = sorted_messages[-1]
-            first_created_at = datetime.fromisoformat(first_message['createdAt'].replace('Z', '+00:00'))
-            last_created_at = datetime.fromisoformat(last_message['createdAt'].replace('Z', '+00:00'))
-            sampling_size = last_message.get("samplingSize", 0) or 0
-            sampling_rate = last_message.get("samplingRate", 1) or 1
+            sampling_size = meta["sampling_size"] or 0
+            sampling_rate = meta["sampling_rate"] or 1
             duration = (float(sampling_size) / float(sampling_rate)) if float(sampling_rate) > 0 else 0
-            file_start = first_created_at
-            file_end = last_created_at + timedelta(seconds=duration)
-            return file_start, file_end
+            return meta["first_dt"], meta["last_dt"] + timedelta(seconds=duration)
         except Exception as e:
             logging.error(f"Error getting file times for {filename}: {e}")
             return None, None
@@ -1077,9 +1313,13 @@ class TimeReportFeature:
         mouse_point = self.plot_widgets[idx].plotItem.vb.mapSceneToView(pos)
         x = mouse_point.x() # This is the timestamp
 
-        # Clamp x to the actual data range for better UX
-        if len(self.channel_times) > 0:
-            x = np.clip(x, self.channel_times[0], self.channel_times[-1])
+        # Clamp x to the actual data range for better UX (cached bounds, plain float compares)
+        if self._time_bounds is not None:
+            t_lo, t_hi = self._time_bounds
+            if x < t_lo:
+                x = t_lo
+            elif x > t_hi:
+                x = t_hi
         else:
             # If no data, don't show line
             for vline in self.vlines:
@@ -1096,6 +1336,17 @@ class TimeReportFeature:
 
     def cleanup(self):
         try:
+            self._closed = True
+            if self._loader is not None:
+                # Results already queued for the GUI thread must not reach the deleted widget
+                for sig in (self._loader.progress, self._loader.finished, self._loader.error):
+                    try:
+                        sig.disconnect()
+                    except TypeError:
+                        pass
+            if self._load_thread is not None:
+                self._load_thread.quit()
+                self._load_thread.wait()
             self.clear_plots()
             if self.widget:
                 self.widget.setParent(None)
@@ -3,7 +3,7 @@ from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollAr
 from PyQt5.QtCore import QObject, QEvent, Qt, QTimer
 from PyQt5.QtGui import QIcon, QFont
 from pyqtgraph import PlotWidget, mkPen, AxisItem, SignalProxy, InfiniteLine
-from datetime import datetime, timedelta
+from datetime import datetime
 import time
 import logging
 
@@ -83,6 +83,9 @@ class TimeViewFeature:
         self.plots = []
         self.fifo_data = []
         self.fifo_times = []
+        # fifo_data/fifo_times hold each window twice back to back (mirrored ring, see fifo_write);
+        # per-channel ring write position = index of the oldest sample
+        self.fifo_write_idx = []
         self.vlines = []
         self.proxies = []
         self.trackers = []
@@ -331,6 +334,7 @@ class TimeViewFeature:
         self.plots = []
         self.fifo_data = []
         self.fifo_times = []
+        self.fifo_write_idx = []
         self.vlines = []
         self.proxies = []
         self.trackers = []
@@ -435,6 +439,7 @@ class TimeViewFeature:
 
             self.fifo_data.append([])
             self.fifo_times.append([])
+            self.fifo_write_idx.append(0)
             self.needs_refresh.append(True)
 
             self.scroll_layout.addWidget(plot_widget)
@@ -461,12 +466,12 @@ class TimeViewFeature:
             return
 
         self.fifo_window_samples = int(self.sample_rate * self.window_seconds)
-        current_time = datetime.now()
         time_step = 1.0 / self.sample_rate
+        # Unix seconds (float64) ending now, one sample apart
+        window_times = time.time() - np.arange(self.fifo_window_samples - 1, -1, -1, dtype=np.float64) * time_step
 
         for i in range(self.num_plots):
-            self.fifo_data[i] = np.zeros(self.fifo_window_samples)
-            self.fifo_times[i] = np.array([current_time - timedelta(seconds=(self.fifo_window_samples - 1 - j) * time_step) for j in range(self.fifo_window_samples)])
+            self.fifo_set(i, window_times, np.zeros(self.fifo_window_samples))
             self.needs_refresh[i] = True
 
         self.is_initialized = True
@@ -506,22 +511,24 @@ class TimeViewFeature:
             return
 
         new_fifo_window_samples = int(self.sample_rate * self.window_seconds)
-        current_time = datetime.now()
         time_step = 1.0 / self.sample_rate
+        # Seconds before the first retained sample for each padded slot (pad, pad-1, ..., 1 steps)
+        pad_steps = np.arange(new_fifo_window_samples, 0, -1, dtype=np.float64) * time_step
 
         for i in range(self.num_plots):
-            current_data = self.fifo_data[i]
-            current_times = self.fifo_times[i]
+            current_times, current_data = self.fifo_view(i)
             new_data = np.zeros(new_fifo_window_samples)
-            new_times = np.array([current_time - timedelta(seconds=(new_fifo_window_samples - 1 - j) * time_step) for j in range(new_fifo_window_samples)])
+            new_times = time.time() - (pad_steps - time_step)
 
-            copy_length = min(len(current_data), new_fifo_window_samples)
+            copy_length = min(len(current_data), len(current_times), new_fifo_window_samples)
             if copy_length > 0:
-                new_data[-copy_length:] = current_data[-copy_length:]
-                new_times[-copy_length:] = current_times[-copy_length:] if len(current_times) >= copy_length else new_times[-copy_length:]
+                pad = new_fifo_window_samples - copy_length
+                new_data[pad:] = current_data[-copy_length:]
+                new_times[pad:] = current_times[-copy_length:]
+                # Back-fill from the oldest retained sample so the window stays strictly increasing
+                new_times[:pad] = new_times[pad] - pad_steps[new_fifo_window_samples - pad:]
 
-            self.fifo_data[i] = new_data
-            self.fifo_times[i] = new_times
+            self.fifo_set(i, new_times, new_data)
             self.needs_refresh[i] = True
 
         self.fifo_window_samples = new_fifo_window_samples
@@ -564,6 +571,8 @@ class TimeViewFeature:
                 self.initialize_plots(self.total_channels)
 
             time_step = 1.0 / sample_rate
+            # Seconds from the previous last sample to each new sample (1..S steps), shared by all channels
+            frame_offsets = np.arange(1, self.samples_per_channel + 1, dtype=np.float64) * time_step
 
             for ch in range(self.total_channels):
                 channel_name = self.channel_names[ch] if ch < len(self.channel_names) else f"Channel {ch + 1}"
@@ -578,17 +587,10 @@ class TimeViewFeature:
                 volts = (np.array(values[ch]) - self.off_set) * self.scaling_factor
                 # Build continuous timestamps by extending from previous last timestamp if available
                 if isinstance(self.fifo_times[ch], np.ndarray) and self.fifo_times[ch].size > 0:
-                    last_time = self.fifo_times[ch][-1]
-                    # Ensure last_time is datetime
-                    try:
-                        base_time = last_time if isinstance(last_time, datetime) else datetime.fromtimestamp(float(last_time))
-                    except Exception:
-                        base_time = datetime.now()
-                    new_times = np.array([base_time + timedelta(seconds=(i + 1) * time_step) for i in range(self.samples_per_channel)])
+                    new_times = float(self.fifo_view(ch)[0][-1]) + frame_offsets
                 else:
                     # First fill: anchor to now and backfill
-                    current_time = datetime.now()
-                    new_times = np.array([current_time - timedelta(seconds=(self.samples_per_channel - 1 - i) * time_step) for i in range(self.samples_per_channel)])
+                    new_times = time.time() + (frame_offsets - frame_offsets[-1])
                 # new_data = volts
 
                 if ch < self.main_channels:
@@ -601,19 +603,15 @@ class TimeViewFeature:
                     # Trigger channel: use payload directly and clamp to 0..1
                     new_data = np.clip(np.array(values[ch], dtype=np.float64), 0.0, 1.0)
 
-                if len(self.fifo_data[ch]) != self.fifo_window_samples:
-                    self.fifo_data[ch] = np.zeros(self.fifo_window_samples)
+                if len(self.fifo_data[ch]) != 2 * self.fifo_window_samples:
                     # Initialize time buffer so that it ends at the last new_times value
-                    end_time = new_times[-1] if isinstance(new_times[-1], datetime) else datetime.now()
-                    self.fifo_times[ch] = np.array([end_time - timedelta(seconds=(self.fifo_window_samples - 1 - j) * time_step) for j in range(self.fifo_window_samples)])
+                    self.fifo_set(ch, new_times[-1] - np.arange(self.fifo_window_samples - 1, -1, -1, dtype=np.float64) * time_step,
+                                  np.zeros(self.fifo_window_samples))
 
-                self.fifo_data[ch] = np.roll(self.fifo_data[ch], -self.samples_per_channel)
-                self.fifo_data[ch][-self.samples_per_channel:] = new_data
-                self.fifo_times[ch] = np.roll(self.fifo_times[ch], -self.samples_per_channel)
-                self.fifo_times[ch][-self.samples_per_channel:] = new_times
+                self.fifo_write(ch, new_times, new_data)
                 self.needs_refresh[ch] = True
 
-            # Do not sort the time arrays each update; rolling maintains chronological order
+            # Do not sort the time arrays each update; the ring keeps them chronological from the write index
             # Simply mark channels for refresh (already set during update)
 
             self.refresh_plots()
@@ -621,6 +619,45 @@ class TimeViewFeature:
             logging.error(f"Error processing data: {str(e)}")
             self.log_and_set_status(f"Error processing data: {str(e)}")
 
+    def fifo_set(self, ch, times, data):
+        """Replace channel ch's window with in-order times/data (stored mirrored, oldest first)."""
+        self.fifo_times[ch] = np.concatenate((times, times)).astype(np.float64, copy=False)
+        self.fifo_data[ch] = np.concatenate((data, data)).astype(np.float64, copy=False)
+        self.fifo_write_idx[ch] = 0
+
+    def fifo_write(self, ch, new_times, new_data):
+        """Overwrite the oldest samples of channel ch's ring buffer in place (O(frame), no window copy).
+
+        Every sample is written at ring position p and its mirror p + window, so the window in
+        time order is always the contiguous slice [write_idx, write_idx + window).
+        """
+        times, data = self.fifo_times[ch], self.fifo_data[ch]
+        size = len(data) // 2
+        count = len(new_data)
+        if count >= size:
+            # Frame covers the whole window: keep its newest samples, back in order
+            for base in (0, size):
+                times[base:base + size] = new_times[-size:]
+                data[base:base + size] = new_data[-size:]
+            self.fifo_write_idx[ch] = 0
+            return
+        start = self.fifo_write_idx[ch]
+        split = min(count, size - start)
+        for base in (0, size):
+            times[base + start:base + start + split] = new_times[:split]
+            data[base + start:base + start + split] = new_data[:split]
+            # Remainder wraps to the front of the ring
+            times[base:base + count - split] = new_times[split:]
+            data[base:base + count - split] = new_data[split:]
+        self.fifo_write_idx[ch] = (start + count) % size
+
+    def fifo_view(self, ch):
+        """Chronological (times, data) views of channel ch's window, oldest sample first (no copy)."""
+        times, data = self.fifo_times[ch], self.fifo_data[ch]
+        start = self.fifo_write_idx[ch]
+        end = start + len(data) // 2
+        return times[start:end], data[start:end]
+
     def refresh_plots(self):
         # Skip refresh until plots/buffers are initialized
         if self.is_scrolling or not self.is_initialized or not self.num_plots or self.num_plots <= 0:
@@ -633,7 +670,7 @@ class TimeViewFeature:
                     ends = []
                     for i in range(int(self.num_plots)):
                         if isinstance(self.fifo_times[i], np.ndarray) and len(self.fifo_times[i]) > 0:
-                            ends.append(self.fifo_times[i][-1].timestamp())
+                            ends.append(float(self.fifo_view(i)[0][-1]))
                     if ends:
                         common_end_ts = max(ends)
                 except Exception:
@@ -645,8 +682,9 @@ class TimeViewFeature:
                 if len(self.fifo_data[i]) == 0 or len(self.fifo_times[i]) == 0:
                     continue
                 # Only update data on the existing PlotDataItem to avoid churn
-                time_data = np.array([t.timestamp() for t in self.fifo_times[i]])
-                self.plots[i].setData(time_data, self.fifo_data[i])
+                # Contiguous in-order views straight into the mirrored ring; nothing is copied per paint
+                time_data, plot_data = self.fifo_view(i)
+                self.plots[i].setData(time_data, plot_data)
                 if len(time_data) > 0:
                     if common_end_ts is not None and self.window_seconds:
                         x_max = common_end_ts
@@ -714,9 +752,9 @@ class TimeViewFeature:
             if not self.is_initialized or len(self.fifo_data) != self.total_channels:
                 self.initialize_plots(total_channels)
 
-            created_at = datetime.fromisoformat(message['createdAt'].replace('Z', '+00:00'))
+            created_at = datetime.fromisoformat(message['createdAt'].replace('Z', '+00:00')).timestamp()
             time_step = 1.0 / sample_rate
-            new_times = np.array([created_at + timedelta(seconds=i * time_step) for i in range(samples_per_channel)])
+            new_times = created_at + np.arange(samples_per_channel, dtype=np.float64) * time_step
 
             for ch in range(self.total_channels):
                 channel_name = self.channel_names[ch] if ch < len(self.channel_names) else f"Channel {ch + 1}"
@@ -738,8 +776,7 @@ class TimeViewFeature:
                     # Trigger 0..1
                     new_data = np.clip(np.array(values[ch], dtype=np.float64), 0.0, 1.0)
 
-                self.fifo_data[ch] = new_data
-                self.fifo_times[ch] = new_times
+                self.fifo_set(ch, new_times, new_data)
                 self.needs_refresh[ch] = True
 
             self.refresh_plots()
@@ -784,14 +821,14 @@ class TimeViewFeature:
 
             if created_at_str:
                 try:
-                    created_at = datetime.fromisoformat(str(created_at_str).replace('Z', '+00:00'))
+                    created_at = datetime.fromisoformat(str(created_at_str).replace('Z', '+00:00')).timestamp()
                 except Exception:
-                    created_at = datetime.now()
+                    created_at = time.time()
             else:
-                created_at = datetime.now()
+                created_at = time.time()
 
             time_step = 1.0 / sample_rate
-            new_times = np.array([created_at + timedelta(seconds=i * time_step) for i in range(samples_per_channel)])
+            new_times = created_at + np.arange(samples_per_channel, dtype=np.float64) * time_step
 
             for ch in range(self.total_channels):
                 channel_name = self.channel_names[ch] if ch < len(self.channel_names) else f"Channel {ch + 1}"
@@ -816,8 +853,7 @@ class TimeViewFeature:
                 else:
                     new_data = volts
 
-                self.fifo_data[ch] = np.array(new_data)
-                self.fifo_times[ch] = np.array(new_times)
+                self.fifo_set(ch, new_times, new_data)
                 self.needs_refresh[ch] = True
 
             self.refresh_plots()
@@ -844,13 +880,13 @@ class TimeViewFeature:
             return
         mouse_point = self.plot_widgets[idx].plotItem.vb.mapSceneToView(pos)
         x = mouse_point.x()
-        times = self.fifo_times[idx]
+        times = self.fifo_view(idx)[0]
         if len(times) > 0:
-            time_stamps = np.array([t.timestamp() for t in times])
-            if x < time_stamps[0]:
-                x = time_stamps[0]
-            elif x > time_stamps[-1]:
-                x = time_stamps[-1]
+            first, last = times[0], times[-1]
+            if x < first:
+                x = first
+            elif x > last:
+                x = last
             for vline in self.vlines:
                 vline.setPos(x)
                 vline.setVisible(True)
@@ -876,6 +912,7 @@ class TimeViewFeature:
             self.plots = []
             self.fifo_data = []
             self.fifo_times = []
+            self.fifo_write_idx = []
             self.vlines = []
             self.proxies = []
             self.trackers = []
@@ -1,6 +1,7 @@
 import paho.mqtt.client as mqtt
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 import struct
+import numpy as np
 import re
 import json
 import logging
@@ -249,12 +250,8 @@ class MQTTHandler(QObject):
                         # Extract gap voltages from header[15]..header[28] (inclusive) as signed int16 and scale by 1/100
                         try:
                             if len(header) >= 29:
-                                signed_gaps = []
-                                for h in header[15:29]:
-                                    # Convert from uint16 to int16
-                                    if h >= 32768:
-                                        h = h - 65536
-                                    signed_gaps.append(float(h) / 100.0)
+                                # Reinterpret the raw header words as little-endian int16 in one slice
+                                signed_gaps = (np.frombuffer(payload, dtype='<i2', count=14, offset=15 * 2) / 100.0).tolist()
                                 # Emit asynchronously for interested features (e.g., Tabular View)
                                 self.gap_values_received.emit(model_name, tag_name, signed_gaps)
                         except Exception: